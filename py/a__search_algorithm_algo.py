@@ -63,6 +63,7 @@ The heuristic function h(n) is problem-specific and should be admissible (never
 - Greedy Best-First Search: A* with g(n) = 0.
 - Weighted A*: Modifies the heuristic function to speed up the search at the cost of optimality.
 - Iterative Deepening A*: Combines A* with Iterative Deepening Depth-First Search to reduce memory usage.
+- CSR A*: astar_csr() runs on a CSRGraph (csr_graph_algo.py) with a binary heap as the open set.
 """
 
 ## 7. Trade-offs
@@ -121,3 +122,47 @@ def reconstruct_path(came_from, current):
         current = came_from[current]
         total_path.append(current)
     return total_path[::-1]
+
+def astar_csr(graph, start, goal, heuristic):
+    """
+    astar_search() on a weighted CSRGraph (csr_graph_algo.py).
+
+    heuristic(node, goal) is still called with the original labels, once per
+    vertex at most. The open set is a heap with lazy deletion instead of a
+    min() scan over a set. Returns the path as a list of labels.
+    """
+    import heapq
+    offsets, targets, weights, labels = graph.offsets, graph.targets, graph.weights, graph.labels
+    source, target = graph.ids[start], graph.ids[goal]
+    came_from = [-1] * graph.n
+    g_score = [float('inf')] * graph.n
+    h_score = [None] * graph.n
+    closed = bytearray(graph.n)
+    g_score[source] = 0
+    h_score[source] = heuristic(start, goal)
+    open_heap = [(h_score[source], source)]
+
+    while open_heap:
+        _, current = heapq.heappop(open_heap)
+        if closed[current]:
+            continue
+        if current == target:
+            path = [current]
+            while came_from[current] != -1:
+                current = came_from[current]
+                path.append(current)
+            return [labels[v] for v in reversed(path)]
+
+        closed[current] = 1
+        for i in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[i]
+            tentative_g_score = g_score[current] + weights[i]
+            if tentative_g_score < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                if h_score[neighbor] is None:
+                    h_score[neighbor] = heuristic(labels[neighbor], goal)
+                closed[neighbor] = 0  # reopen, as astar_search() does for inconsistent heuristics
+                heapq.heappush(open_heap, (tentative_g_score + h_score[neighbor], neighbor))
+
+    return "Failure: No path found"
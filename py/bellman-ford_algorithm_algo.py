@@ -39,6 +39,7 @@ The core idea of the Bellman-Ford algorithm is to iteratively relax all the edge
 ## 6. Common Variants
 """
 - **Johnson's Algorithm:** Uses Bellman-Ford as a subroutine to handle graphs with negative weights, allowing Dijkstra's algorithm to be used on all pairs of shortest paths.
+- **CSR Bellman-Ford:** bellman_ford_csr() relaxes the int arrays of a CSRGraph (csr_graph_algo.py) and stops after the first pass without an update.
 """
 
 ## 7. Trade-offs
@@ -85,6 +86,36 @@ def bellman_ford(graph, source):
 
     return distance
 
+def bellman_ford_csr(graph, source):
+    # Same as bellman_ford() on a weighted CSRGraph (csr_graph_algo.py); returns distances indexed by vertex id
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = graph.n
+    distance = [float('inf')] * n
+    distance[graph.ids[source]] = 0
+
+    # Relax edges up to |V|-1 times; a pass without updates means we are done
+    for _ in range(n - 1):
+        updated = False
+        for u in range(n):
+            du = distance[u]
+            if du == float('inf'):
+                continue
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if du + weights[i] < distance[v]:
+                    distance[v] = du + weights[i]
+                    updated = True
+        if not updated:
+            return distance
+
+    # Check for negative-weight cycles
+    for u in range(n):
+        for i in range(offsets[u], offsets[u + 1]):
+            if distance[u] + weights[i] < distance[targets[i]]:
+                raise ValueError("Graph contains a negative weight cycle")
+
+    return distance
+
 # Example usage:
 # graph = {
 #     'A': [('B', 1), ('C', 4)],
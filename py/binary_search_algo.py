@@ -49,8 +49,10 @@ The core intuition behind Binary Search is that by leveraging the sorted order o
 
 ## 6. Common Variants
 """
-- **Lower Bound**: Finds the first occurrence of a target value.
-- **Upper Bound**: Finds the last occurrence of a target value.
+- **Lower Bound**: Finds the first index whose value is not less than the target (the first occurrence, if present).
+- **Upper Bound**: Finds the first index whose value is greater than the target (one past the last occurrence).
+- **Equal Range**: The pair (lower bound, upper bound), i.e. the slice holding every occurrence of the target.
+- **Batched Search**: Answers many targets at once, with vectorized searchsorted or a single merge pass when the targets are sorted.
 - **Rotated Array Search**: Adapts binary search to find elements in a rotated sorted array.
 """
 
@@ -80,6 +82,10 @@ The core intuition behind Binary Search is that by leveraging the sorted order o
 """
 
 ## 10. Code Implementation (Demo)
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 def binary_search(arr, target):
     low, high = 0, len(arr) - 1
@@ -99,3 +105,90 @@ def binary_search(arr, target):
 # arr = [1, 2, 3, 4, 5, 6, 7, 8, 9]
 # target = 4
 # print(binary_search(arr, target)) # Output: 3
+
+def lower_bound(arr, target, low=0, high=None):
+    """Returns the first index in arr[low:high] whose value is >= target."""
+    if high is None:
+        high = len(arr)
+
+    while low < high:
+        mid = (low + high) // 2
+        if arr[mid] < target:
+            low = mid + 1
+        else:
+            high = mid
+
+    return low
+
+def upper_bound(arr, target, low=0, high=None):
+    """Returns the first index in arr[low:high] whose value is > target."""
+    if high is None:
+        high = len(arr)
+
+    while low < high:
+        mid = (low + high) // 2
+        if target < arr[mid]:
+            high = mid
+        else:
+            low = mid + 1
+
+    return low
+
+def equal_range(arr, target):
+    """Returns (first, last + 1): arr[first:last + 1] holds every occurrence of target."""
+    first = lower_bound(arr, target)
+    return first, upper_bound(arr, target, first)
+
+def _merge_bounds(arr, targets, side):
+    """Resolves sorted targets with one forward pass over arr (O(n + m))."""
+    result = []
+    i, n = 0, len(arr)
+    if side == "left":
+        for t in targets:
+            while i < n and arr[i] < t:
+                i += 1
+            result.append(i)
+    else:
+        for t in targets:
+            while i < n and not t < arr[i]:
+                i += 1
+            result.append(i)
+    return result
+
+def batch_search(arr, targets, side="left"):
+    """
+    Returns lower bounds (side="left") or upper bounds (side="right") for every target.
+
+    Always returns a list of ints. With NumPy the bounds come from one
+    vectorized searchsorted call. Otherwise sorted targets are resolved by
+    a single merge pass over arr when that is cheaper than m binary
+    searches, and unsorted targets fall back to one lower_bound/upper_bound
+    per target.
+    """
+    if np is not None:
+        return np.searchsorted(np.asarray(arr), np.asarray(targets), side=side).tolist()
+
+    m, n = len(targets), len(arr)
+    targets_sorted = all(not targets[i + 1] < targets[i] for i in range(m - 1))
+    if targets_sorted and n + m < m * max(1, n.bit_length()):
+        return _merge_bounds(arr, targets, side)
+    bound = lower_bound if side == "left" else upper_bound
+    return [bound(arr, t) for t in targets]
+
+def batch_binary_search(arr, targets):
+    """Batched binary_search(): a list with the index of each target, or -1 where it is absent."""
+    if np is not None:
+        values, wanted = np.asarray(arr), np.asarray(targets)
+        starts = np.searchsorted(values, wanted, side="left")
+        found = starts < len(values)
+        found[found] = values[starts[found]] == wanted[found]
+        return np.where(found, starts, -1).tolist()
+    starts = batch_search(arr, targets, side="left")
+    n = len(arr)
+    return [i if i < n and arr[i] == t else -1 for i, t in zip(starts, targets)]
+
+# Example usage:
+# arr = [1, 2, 2, 2, 5, 8]
+# print(lower_bound(arr, 2), upper_bound(arr, 2), equal_range(arr, 2))  # Output: 1 4 (1, 4)
+# print(batch_search(arr, [0, 2, 6, 9]))  # Output: [0, 1, 5, 6]
+# print(batch_binary_search(arr, [5, 3, 1]))  # Output: [4, -1, 0]
@@ -18,6 +18,21 @@ The core idea of BFS is to explore the neighbor nodes at the present depth prior
    - Process the dequeued node (usually involves recording its value or performing some operation).
    - Enqueue all its adjacent, unvisited nodes, marking them as visited.
 3. Repeat the process until the queue is empty.
+
+Level-synchronous form (bfs_search):
+1. The frontier starts as the list of sources at depth 0.
+2. Scanning the whole frontier builds the next frontier at depth + 1; each newly discovered vertex records its distance and parent.
+3. Stop when the frontier is empty, the target has been discovered, or max_depth is reached.
+
+Direction-optimizing form (bfs_direction_optimizing):
+1. Top-down step: every frontier vertex checks its out-edges for unvisited vertices (as above).
+2. Bottom-up step: every unvisited vertex checks its in-edges for a parent in the frontier bitset and stops at the first hit.
+3. Switch to bottom-up when the frontier's out-edges exceed 1/alpha of the unexplored vertices' edges; switch back when the frontier holds fewer than n/beta vertices.
+
+Multi-source bitset form (multi_source_bfs), for k searches at once:
+1. Bit i of seen[v] / visit[v] says whether search i has seen / just reached v.
+2. Each level scans the out-edges of every vertex with a non-zero visit mask once: visit_next[w] |= visit[v].
+3. new = visit_next[w] & ~seen[w] are the searches reaching w at this depth; record the depth for each set bit and add them to seen[w].
 """
 
 ## 4. Time & Space Complexity
@@ -46,6 +61,10 @@ BFS is used in:
 - Bidirectional BFS: Used to reduce the search space by simultaneously exploring from both the start and target nodes.
 - Multi-source BFS: Initiates BFS from multiple sources simultaneously.
 - Layered BFS: Used in network flow algorithms like Dinic's algorithm.
+- CSR BFS: bfs_csr() runs on the int arrays of a CSRGraph (csr_graph_algo.py) instead of hashing vertex labels.
+- Depth-limited / early-exit BFS: bfs_search() with max_depth or target; bfs_iter() streams (node, depth) lazily.
+- Direction-optimizing BFS (Beamer et al.): bfs_direction_optimizing() alternates top-down and bottom-up steps, skipping most edge checks on low-diameter, power-law graphs.
+- Multi-source bitset BFS (MS-BFS, Then et al.): multi_source_bfs() runs a batch of independent searches together, one bit per search, so each edge is scanned once per batch.
 """
 
 ## 7. Trade-offs
@@ -58,6 +77,8 @@ BFS is used in:
 ## 8. Pitfalls / Gotchas
 """
 - Ensure all nodes are marked as visited to prevent infinite loops.
+- list.pop(0) is O(n), which makes BFS quadratic; use collections.deque or a frontier list per level.
+- Mark nodes visited when they are enqueued, not when they are dequeued, or nodes get queued many times.
 - BFS may not be feasible in extremely large graphs due to memory constraints.
 - It is important to correctly handle graph structures (e.g., adjacency list vs adjacency matrix) to optimize performance.
 """
@@ -70,17 +91,20 @@ BFS is used in:
 """
 
 ## 10. Code Implementation (Demo)
+from collections import deque
+
+
 def bfs(graph, start):
     visited = set()
-    queue = []
+    queue = deque()
 
     # Initialize the BFS with the start node
     queue.append(start)
     visited.add(start)
 
     while queue:
-        # Dequeue a vertex from the queue
-        current = queue.pop(0)
+        # Dequeue a vertex from the queue (O(1) on a deque)
+        current = queue.popleft()
         print(current, end=" ")
 
         # Get all adjacent vertices of the dequeued vertex current
@@ -90,16 +114,389 @@ def bfs(graph, start):
                 queue.append(neighbor)
                 visited.add(neighbor)
 
+def bfs_csr(graph, start):
+    """
+    BFS over a CSRGraph (csr_graph_algo.py); returns the vertex ids in visit order.
+
+    The queue is a plain list read through a head index, and visited is a
+    bytearray indexed by id, so no vertex label is hashed after conversion.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.n)
+    source = graph.ids[start]
+    visited[source] = 1
+    order = [source]
+    head = 0
+
+    while head < len(order):
+        current = order[head]
+        head += 1
+        for i in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[i]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                order.append(neighbor)
+
+    return order
+
+def bfs_search(graph, sources, target=None, max_depth=None):
+    """
+    Level-synchronous BFS from one or more sources; returns (distance, parent).
+
+    graph is a dict-of-lists or a CSRGraph (csr_graph_algo.py). For dicts,
+    distance and parent are dicts over the reached nodes and parent[source]
+    is None. For a CSRGraph they are array('q') indexed by vertex id, with
+    -1 for unreached vertices and parent[source] == source.
+
+    The search stops as soon as `target` is discovered (its distance is final
+    at that point) and does not expand nodes at depth max_depth.
+    """
+    if hasattr(graph, "offsets"):
+        return _bfs_search_csr(graph, sources, target, max_depth)
+
+    distance = {}
+    parent = {}
+    frontier = []
+    for source in sources:
+        if source not in distance:
+            distance[source] = 0
+            parent[source] = None
+            frontier.append(source)
+    if target is not None and target in distance:
+        return distance, parent
+
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        next_frontier = []
+        for current in frontier:
+            for neighbor in graph[current]:
+                if neighbor not in distance:
+                    distance[neighbor] = depth
+                    parent[neighbor] = current
+                    if neighbor == target:
+                        return distance, parent
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    return distance, parent
+
+def _bfs_search_csr(graph, sources, target, max_depth):
+    from array import array
+
+    offsets, targets = graph.offsets, graph.targets
+    distance = array('q', [-1]) * graph.n
+    parent = array('q', [-1]) * graph.n
+    goal = graph.ids[target] if target is not None else -1
+    frontier = []
+    for source in sources:
+        s = graph.ids[source]
+        if distance[s] == -1:
+            distance[s] = 0
+            parent[s] = s
+            frontier.append(s)
+    if goal != -1 and distance[goal] != -1:
+        return distance, parent
+
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        next_frontier = []
+        for current in frontier:
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[i]
+                if distance[neighbor] == -1:
+                    distance[neighbor] = depth
+                    parent[neighbor] = current
+                    if neighbor == goal:
+                        return distance, parent
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    return distance, parent
+
+def bfs_iter(graph, sources, max_depth=None):
+    """
+    Generator streaming (node, depth) pairs in BFS order as nodes are dequeued.
+
+    Works on a dict-of-lists or a CSRGraph (then nodes are vertex ids).
+    Stopping iteration early stops the search, so this is the cheapest way to
+    look at the first few levels of a huge graph.
+    """
+    csr = hasattr(graph, "offsets")
+    if csr:
+        offsets, targets = graph.offsets, graph.targets
+        visited = bytearray(graph.n)
+        sources = [graph.ids[source] for source in sources]
+    else:
+        visited = set()
+
+    queue = deque()
+    for source in sources:
+        if csr:
+            if visited[source]:
+                continue
+            visited[source] = 1
+        else:
+            if source in visited:
+                continue
+            visited.add(source)
+        queue.append((source, 0))
+
+    while queue:
+        current, depth = queue.popleft()
+        yield current, depth
+        if max_depth is not None and depth >= max_depth:
+            continue
+        if csr:
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[i]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append((neighbor, depth + 1))
+        else:
+            for neighbor in graph[current]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append((neighbor, depth + 1))
+
+def bfs_direction_optimizing(graph, sources, alpha=15, beta=18, reverse=None, stats=None):
+    """
+    Direction-optimizing BFS on a CSRGraph (csr_graph_algo.py); returns (distance, parent) like bfs_search().
+
+    Top-down steps expand the frontier list. Bottom-up steps let each
+    unvisited vertex scan its in-edges (from `reverse`, the transposed graph;
+    computed if not given, pass it in for repeated searches) for a parent in
+    the frontier and stop at the first one found. The visited and frontier
+    sets are bitsets packed into bytearrays.
+
+    The search switches to bottom-up when frontier out-edges * alpha exceed
+    the out-edges of unvisited vertices, and back to top-down when the
+    frontier shrinks below n / beta vertices. alpha=0 gives plain top-down
+    BFS. If `stats` is a dict, it receives the number of edges_checked and
+    of top_down_levels and bottom_up_levels.
+    """
+    from array import array
+
+    n = graph.n
+    offsets, targets = graph.offsets, graph.targets
+    if reverse is None:
+        reverse = graph.transpose()
+    in_offsets, in_targets = reverse.offsets, reverse.targets
+
+    distance = array('q', [-1]) * n
+    parent = array('q', [-1]) * n
+    visited = bytearray((n + 7) >> 3)
+    frontier = []
+    for source in sources:
+        s = graph.ids[source]
+        if not visited[s >> 3] >> (s & 7) & 1:
+            visited[s >> 3] |= 1 << (s & 7)
+            distance[s] = 0
+            parent[s] = s
+            frontier.append(s)
+
+    frontier_edges = sum(offsets[s + 1] - offsets[s] for s in frontier)
+    unexplored_edges = graph.m - frontier_edges
+    edges_checked = top_down_levels = bottom_up_levels = 0
+    bottom_up = False
+    depth = 0
+
+    while frontier:
+        depth += 1
+        if not bottom_up and frontier_edges * alpha > unexplored_edges:
+            bottom_up = True
+        elif bottom_up and len(frontier) * beta < n:
+            bottom_up = False
+
+        next_frontier = []
+        next_edges = 0
+        if bottom_up:
+            bottom_up_levels += 1
+            in_frontier = bytearray((n + 7) >> 3)
+            for u in frontier:
+                in_frontier[u >> 3] |= 1 << (u & 7)
+            for byte_index, byte in enumerate(visited):
+                if byte == 0xFF:
+                    continue  # 8 visited vertices at once
+                for v in range(byte_index << 3, min(n, (byte_index << 3) + 8)):
+                    if byte >> (v & 7) & 1:
+                        continue
+                    for i in range(in_offsets[v], in_offsets[v + 1]):
+                        edges_checked += 1
+                        u = in_targets[i]
+                        if in_frontier[u >> 3] >> (u & 7) & 1:
+                            distance[v] = depth
+                            parent[v] = u
+                            next_frontier.append(v)
+                            next_edges += offsets[v + 1] - offsets[v]
+                            break
+            for v in next_frontier:
+                visited[v >> 3] |= 1 << (v & 7)
+        else:
+            top_down_levels += 1
+            for u in frontier:
+                edges_checked += offsets[u + 1] - offsets[u]
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = targets[i]
+                    if not visited[v >> 3] >> (v & 7) & 1:
+                        visited[v >> 3] |= 1 << (v & 7)
+                        distance[v] = depth
+                        parent[v] = u
+                        next_frontier.append(v)
+                        next_edges += offsets[v + 1] - offsets[v]
+
+        frontier = next_frontier
+        frontier_edges = next_edges
+        unexplored_edges -= next_edges
+
+    if stats is not None:
+        stats["edges_checked"] = stats.get("edges_checked", 0) + edges_checked
+        stats["top_down_levels"] = stats.get("top_down_levels", 0) + top_down_levels
+        stats["bottom_up_levels"] = stats.get("bottom_up_levels", 0) + bottom_up_levels
+    return distance, parent
+
+def _power_law_graph(n, avg_degree, seed):
+    """Random undirected CSRGraph (csr_graph_algo.py) on ids 0..n-1 with a few hubs and many leaves."""
+    import random
+
+    from key_sort_algo import load_module
+
+    csr_graph = load_module("csr_graph_algo.py")
+    rng = random.Random(seed)
+    # Squaring a uniform variate skews endpoints towards low ids
+    edges = [(int(n * rng.random() ** 2), rng.randrange(n), 1) for _ in range(n * avg_degree // 2)]
+    return csr_graph.CSRGraph.from_edges(edges, vertices=range(n))
+
+def benchmark_direction_optimizing(n=200_000, avg_degree=16, seed=0):
+    """Edge checks and time of top-down (alpha=0) vs direction-optimizing BFS on a random power-law graph."""
+    import time
+
+    graph = _power_law_graph(n, avg_degree, seed)
+    reverse = graph  # undirected: in-edges are the out-edges
+
+    for name, alpha in (("top-down", 0), ("direction-optimizing", 15)):
+        stats = {}
+        start = time.perf_counter()
+        bfs_direction_optimizing(graph, [0], alpha=alpha, reverse=reverse, stats=stats)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<22} {elapsed:.2f}s  edges checked {stats['edges_checked']:>12,}  "
+              f"levels top-down/bottom-up {stats['top_down_levels']}/{stats['bottom_up_levels']}")
+
+def multi_source_bfs_rows(graph, sources, batch_size=64):
+    """
+    Multi-source bitset BFS (MS-BFS) on a CSRGraph (csr_graph_algo.py).
+
+    Runs the searches in batches of batch_size (None: all in one batch;
+    Python ints make any width work, 64 matches a machine word). Within a
+    batch, bit i of a vertex's mask belongs to the i-th source, so every
+    edge is scanned once per level for the whole batch instead of once per
+    source. Yields (source, row) in source order, where row is an array('q')
+    of hop distances by vertex id with -1 for unreached vertices.
+    """
+    from array import array
+
+    n = graph.n
+    offsets, targets = graph.offsets, graph.targets
+    sources = list(sources)
+    batch_size = batch_size or max(1, len(sources))
+
+    for first in range(0, len(sources), batch_size):
+        batch = sources[first:first + batch_size]
+        rows = [array('q', [-1]) * n for _ in batch]
+        seen = [0] * n
+        visit = [0] * n
+        frontier = []
+        for i, source in enumerate(batch):
+            s = graph.ids[source]
+            rows[i][s] = 0
+            if not visit[s]:
+                frontier.append(s)
+            seen[s] |= 1 << i
+            visit[s] |= 1 << i
+
+        depth = 0
+        visit_next = [0] * n
+        while frontier:
+            depth += 1
+            touched = []
+            for v in frontier:
+                mask = visit[v]
+                visit[v] = 0
+                for e in range(offsets[v], offsets[v + 1]):
+                    w = targets[e]
+                    if not visit_next[w]:
+                        touched.append(w)
+                    visit_next[w] |= mask
+
+            frontier = []
+            for w in touched:
+                new = visit_next[w] & ~seen[w]
+                visit_next[w] = 0
+                if new:
+                    seen[w] |= new
+                    visit[w] = new
+                    frontier.append(w)
+                    while new:
+                        low = new & -new
+                        rows[low.bit_length() - 1][w] = depth
+                        new ^= low
+
+        yield from zip(batch, rows)
+
+def multi_source_bfs(graph, sources, batch_size=64):
+    """Hop-distance matrix: one row per source, see multi_source_bfs_rows()."""
+    return [row for _, row in multi_source_bfs_rows(graph, sources, batch_size)]
+
+def benchmark_multi_source_bfs(n=100_000, avg_degree=8, sources=64, seed=0):
+    """Time of one bfs_search() per source vs multi_source_bfs() on a random power-law graph."""
+    import time
+
+    graph = _power_law_graph(n, avg_degree, seed)
+    chosen = list(range(0, n, n // sources))[:sources]
+
+    start = time.perf_counter()
+    for source in chosen:
+        bfs_search(graph, [source])
+    separate = time.perf_counter() - start
+
+    start = time.perf_counter()
+    multi_source_bfs(graph, chosen)
+    batched = time.perf_counter() - start
+    print(f"{len(chosen)} x bfs_search: {separate:.2f}s   multi_source_bfs: {batched:.2f}s")
+
+def bfs_path(parent, target):
+    """Rebuilds the source-to-target path from a parent map of bfs_search(); [] if target was not reached."""
+    if isinstance(parent, dict):
+        if target not in parent:
+            return []
+        path = [target]
+        while parent[path[-1]] is not None:
+            path.append(parent[path[-1]])
+    else:
+        if parent[target] == -1:
+            return []
+        path = [target]
+        while parent[path[-1]] != path[-1]:
+            path.append(parent[path[-1]])
+    return path[::-1]
+
 # Example usage:
 # Define a graph using an adjacency list
-graph = {
-    'A': ['B', 'C'],
-    'B': ['A', 'D', 'E'],
-    'C': ['A', 'F'],
-    'D': ['B'],
-    'E': ['B', 'F'],
-    'F': ['C', 'E']
-}
+# graph = {
+#     'A': ['B', 'C'],
+#     'B': ['A', 'D', 'E'],
+#     'C': ['A', 'F'],
+#     'D': ['B'],
+#     'E': ['B', 'F'],
+#     'F': ['C', 'E']
+# }
 
 # Perform BFS starting from node 'A'
-bfs(graph, 'A')
+# bfs(graph, 'A')
+
+# distance, parent = bfs_search(graph, ['A'], target='F')
+# print(distance['F'], bfs_path(parent, 'F'))  # Output: 2 ['A', 'C', 'F']
+# print(list(bfs_iter(graph, ['D', 'F'], max_depth=1)))  # Output: [('D', 0), ('F', 0), ('B', 1), ('C', 1), ('E', 1)]
+# benchmark_direction_optimizing(n=100_000)
+# benchmark_multi_source_bfs()
@@ -46,6 +46,7 @@ These steps leverage the assumption that sorting smaller lists (buckets) is more
 """
 - **Parallel Bucket Sort**: A parallelized version of bucket sort that distributes buckets across multiple processors for concurrent sorting.
 - **Radix Bucket Sort**: Combines bucket sort with radix sort, using bucket sort for each digit or group of digits.
+- **Sample Sort**: Picks bucket boundaries (splitters) from a sorted random sample so buckets stay balanced on skewed data, and assigns each element by binary search over the splitters.
 """
 
 ## 7. Trade-offs
@@ -82,6 +83,8 @@ def bucket_sort(arr):
     bucket_count = len(arr)
     max_value = max(arr)
     min_value = min(arr)
+    if max_value == min_value:
+        return list(arr)
     bucket_size = (max_value - min_value) / bucket_count
 
     buckets = [[] for _ in range(bucket_count)]
@@ -103,3 +106,58 @@ def bucket_sort(arr):
         sorted_array.extend(bucket)
 
     return sorted_array
+
+
+def choose_splitters(arr, bucket_count, oversample=16, rng=None):
+    """Returns bucket_count - 1 splitters taken at even ranks of a sorted random sample."""
+    import random
+
+    rng = rng or random
+    sample = sorted(rng.sample(arr, min(len(arr), bucket_count * oversample)))
+    step = len(sample) / bucket_count
+    return [sample[int(i * step)] for i in range(1, bucket_count)]
+
+
+def sample_sort(arr, bucket_count=None, oversample=16, workers=None, seed=None):
+    """
+    Sorts arr with sample sort and returns a new list.
+
+    Splitters come from a random sample, so each bucket receives about
+    n / bucket_count elements regardless of how the values are distributed.
+    Each element goes to bucket bisect_right(splitters, x). With workers > 1
+    the buckets are sorted concurrently on a process pool; they are then
+    concatenated in order.
+    """
+    import os
+    import random
+    from bisect import bisect_right
+
+    n = len(arr)
+    workers = workers or 1
+    bucket_count = bucket_count or max(1, workers * 4)
+    if n <= 1 or bucket_count == 1:
+        return sorted(arr)
+
+    splitters = choose_splitters(arr, bucket_count, oversample, random.Random(seed))
+    buckets = [[] for _ in range(len(splitters) + 1)]
+    for num in arr:
+        buckets[bisect_right(splitters, num)].append(num)
+
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, os.cpu_count() or 1)) as pool:
+            buckets = list(pool.map(sorted, buckets))
+    else:
+        buckets = [sorted(bucket) for bucket in buckets]
+
+    sorted_array = []
+    for bucket in buckets:
+        sorted_array.extend(bucket)
+    return sorted_array
+
+
+# Example usage
+# import random
+# data = [random.paretovariate(1.5) for _ in range(100_000)]
+# print(sample_sort(data, workers=4) == sorted(data))  # Output: True
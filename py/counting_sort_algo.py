@@ -56,6 +56,7 @@ Counting Sort works by:
 """
 - **Stable Counting Sort**: The version implemented here, which maintains the relative order of equal elements.
 - **In-place Counting Sort**: A variant that aims to reduce space complexity by sorting the array in place, albeit at the cost of stability.
+- **Adaptive Counting Sort**: Profiles the key range first and uses a dense count array only when the range is small relative to n, falling back to a hash-map histogram over the sorted distinct keys for sparse ranges.
 """
 
 ## 7. Trade-offs
@@ -114,3 +115,146 @@ def counting_sort(arr):
         arr[i] = output[i]
     
     return arr
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from key_sort_algo import load_module
+
+# typed_view() is shared with the other buffer sorts in heap_sort_algo.py
+typed_view = load_module("heap_sort_algo.py").typed_view
+
+
+def choose_counting_backend(n, min_key, max_key, density=4, slack=1024):
+    """
+    Picks "dense" when the count array is at most density * n + slack slots, else "sparse".
+
+    Dense ranges use "numpy-dense" when NumPy is installed and the keys fit in int64.
+    """
+    key_range = max_key - min_key + 1
+    if key_range <= density * n + slack:
+        if np is not None and -2**63 <= min_key and max_key < 2**63:
+            return "numpy-dense"
+        return "dense"
+    return "sparse"
+
+
+def adaptive_counting_sort(arr, key=None, density=4, slack=1024):
+    """
+    Stable counting sort that chooses its backend from the key range.
+
+    Without `key` the integers in arr are sorted; with `key` the records in
+    arr are stably sorted by the small integer key(record). Returns a tuple
+    (sorted_list, backend) where backend is "numpy-dense", "dense", "sparse",
+    or "empty" for empty input, so callers can monitor which path was taken.
+    Keys that are not integers raise TypeError.
+    """
+    import operator
+
+    if not arr:
+        return [], "empty"
+
+    keys = arr if key is None else [key(item) for item in arr]
+    try:
+        keys = [operator.index(k) for k in keys]
+    except TypeError:
+        bad = next(k for k in keys if not hasattr(k, "__index__"))
+        raise TypeError(f"adaptive_counting_sort needs integer keys, got {type(bad).__name__}") from None
+    min_key = min(keys)
+    max_key = max(keys)
+    backend = choose_counting_backend(len(keys), min_key, max_key, density, slack)
+
+    if backend == "numpy-dense":
+        shifted = np.fromiter(keys, dtype=np.int64, count=len(keys)) - min_key
+        if key is None:
+            # Histogram + repeat; no scatter needed when items are their own keys
+            count = np.bincount(shifted, minlength=max_key - min_key + 1)
+            return (np.repeat(np.arange(min_key, max_key + 1), count).tolist(), backend)
+        # A stable argsort of the shifted keys keeps equal-key records in input order
+        order = np.argsort(shifted, kind="stable")
+        return [arr[i] for i in order.tolist()], backend
+
+    if backend == "dense":
+        count = [0] * (max_key - min_key + 1)
+        for k in keys:
+            count[k - min_key] += 1
+        if key is None:
+            output = []
+            for offset, c in enumerate(count):
+                if c:
+                    output.extend([min_key + offset] * c)
+            return output, backend
+        total = 0
+        for i, c in enumerate(count):
+            count[i] = total
+            total += c
+        output = [None] * len(arr)
+        for item, k in zip(arr, keys):
+            output[count[k - min_key]] = item
+            count[k - min_key] += 1
+        return output, backend
+
+    # Sparse: hash-map histogram, then one pass over the sorted distinct keys
+    if key is None:
+        count = {}
+        for k in keys:
+            count[k] = count.get(k, 0) + 1
+        output = []
+        for k in sorted(count):
+            output.extend([k] * count[k])
+        return output, backend
+    groups = {}
+    for item, k in zip(arr, keys):
+        groups.setdefault(k, []).append(item)
+    output = []
+    for k in sorted(groups):
+        output.extend(groups[k])
+    return output, backend
+
+
+# Example usage
+# print(adaptive_counting_sort([4, 2, 2, 8, 3, 3, 1]))  # Output: ([1, 2, 2, 3, 3, 4, 8], 'dense')
+# print(adaptive_counting_sort([5, 10**12, -3]))  # Output: ([-3, 5, 1000000000000], 'sparse')
+# records = [("b", 2), ("a", 1), ("c", 2)]
+# print(adaptive_counting_sort(records, key=lambda r: r[1])[0])  # Output: [('a', 1), ('b', 2), ('c', 2)]
+
+
+
+def counting_sort_buffer(buffer, typecode=None, density=4, slack=1024):
+    """
+    Counting sorts an integer array.array, memoryview, mmap or NumPy array in place.
+
+    Only the histogram is kept in Python objects; the sorted values are
+    written straight back into the buffer as runs of packed integers. Sparse
+    ranges use a dict histogram, as in adaptive_counting_sort.
+    """
+    from array import array
+
+    with typed_view(buffer, typecode) as view:
+        code = view.format
+        if code in ("f", "d"):
+            raise TypeError("counting sort needs integer values")
+        if len(view) == 0:
+            return buffer
+
+        min_val = min(view)
+        max_val = max(view)
+        if max_val - min_val + 1 <= density * len(view) + slack:
+            count = [0] * (max_val - min_val + 1)
+            for num in view:
+                count[num - min_val] += 1
+            runs = ((min_val + offset, c) for offset, c in enumerate(count) if c)
+        else:
+            count = {}
+            for num in view:
+                count[num] = count.get(num, 0) + 1
+            runs = ((num, count[num]) for num in sorted(count))
+
+        pos = 0
+        for num, c in runs:
+            view[pos:pos + c] = array(code, [num]) * c
+            pos += c
+    return buffer
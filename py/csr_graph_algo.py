@@ -0,0 +1,242 @@
+# Compressed Sparse Row (CSR) Graph
+
+## 1. Category / Type
+"""
+Graph Representation / Data Structure shared by the graph algorithms (BFS, DFS, Dijkstra, A*, Bellman-Ford, Prim, Kruskal, Floyd-Warshall).
+"""
+
+## 2. Core Idea / Intuition
+"""
+The graph modules each take their own input shape: dict-of-lists, dict-of-dicts, dict of (v, w) lists, edge lists or dense matrices. All of them hash arbitrary vertex objects on every step, and a dict of lists costs roughly 100 bytes per edge in CPython.
+
+CSR stores the same graph in three flat arrays. Vertex labels are interned once to dense ids 0..n-1. The out-edges of vertex u are targets[offsets[u]:offsets[u + 1]], with matching weights[...]. Traversals then index lists and arrays by int instead of hashing labels, and an edge costs 8 bytes (16 with a weight).
+"""
+
+## 3. Steps / Flow
+"""
+1. Intern labels: the dict keys first (in order), then any target not seen yet.
+2. offsets[0] = 0 and offsets[u + 1] = offsets[u] + out-degree(u).
+3. Append the interned targets (and weights) of each vertex in id order.
+4. Algorithms run on ids; results (lists indexed by id) map back to labels with to_dict().
+"""
+
+## 4. Time & Space Complexity
+"""
+| Operation           | Time      | Space       |
+|---------------------|-----------|-------------|
+| Build (any format)  | O(V + E)  | O(V + E)    |
+| Neighbours of u     | O(deg u)  | O(1) (view) |
+| Transpose           | O(V + E)  | O(V + E)    |
+
+- Storage: 8 bytes per vertex offset, 8 per edge target, 8 per edge weight, plus the label table.
+"""
+
+## 5. Use Cases
+"""
+- Traversals and shortest paths on graphs with millions of edges.
+- Sharing one in-memory graph between many algorithms and queries.
+- Handing adjacency to NumPy / SciPy (the arrays are the scipy.sparse.csr_matrix layout).
+"""
+
+## 6. Common Variants
+"""
+- CSC (compressed sparse column): CSR of the transposed graph, i.e. in-edges.
+- COO / edge list: (source, target, weight) triples, easy to build, slow to traverse.
+- Adjacency matrix: O(1) edge lookup, O(V^2) memory.
+"""
+
+## 7. Trade-offs
+"""
+- Pros: compact, cache-friendly, no per-step hashing, zero-copy NumPy views.
+- Cons: static; adding an edge means rebuilding the arrays.
+- Labels must be hashable once (for interning), but never again during traversal.
+"""
+
+## 8. Pitfalls / Gotchas
+"""
+- Undirected edge lists must be stored in both directions (from_edges(..., directed=False)).
+- Vertices that only appear as targets still need an id; they get empty neighbour ranges.
+- Dense matrices encode "no edge" as inf (or None); zeros on the diagonal are not edges.
+"""
+
+## 9. Classic Problems
+"""
+- Storing web-scale or road-network graphs in memory.
+- Sparse matrix-vector products (PageRank, label propagation).
+"""
+
+## 10. Code Implementation (Demo)
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class CSRGraph:
+    """
+    Directed graph in compressed sparse row form over interned int ids.
+
+    offsets and targets are array('q'); weights is array('d') or None for
+    unweighted graphs. labels[i] is the original vertex of id i and ids maps
+    it back.
+    """
+
+    def __init__(self, labels, offsets, targets, weights=None):
+        self.labels = list(labels)
+        self.ids = {label: i for i, label in enumerate(self.labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @property
+    def n(self):
+        return len(self.offsets) - 1
+
+    @property
+    def m(self):
+        return len(self.targets)
+
+    # --- converters from the formats used by the graph modules ---
+
+    @classmethod
+    def _from_rows(cls, rows, weighted):
+        """rows: iterable of (label, [(target, weight), ...] or [target, ...])."""
+        rows = list(rows)
+        ids = {}
+        labels = []
+        for label, _ in rows:
+            ids[label] = len(labels)
+            labels.append(label)
+
+        def intern(label):
+            i = ids.get(label)
+            if i is None:
+                i = ids[label] = len(labels)
+                labels.append(label)
+            return i
+
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d") if weighted else None
+        for _, edges in rows:
+            if weighted:
+                for v, w in edges:
+                    targets.append(intern(v))
+                    weights.append(w)
+            else:
+                targets.extend(intern(v) for v in edges)
+            offsets.append(len(targets))
+        # Target-only vertices have no out-edges
+        offsets.extend([len(targets)] * (len(labels) - len(rows)))
+        return cls(labels, offsets, targets, weights)
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        """dict-of-lists, as taken by bfs() and dfs()."""
+        return cls._from_rows(graph.items(), weighted=False)
+
+    @classmethod
+    def from_weighted_dict(cls, graph):
+        """dict-of-dicts {u: {v: w}}, as taken by dijkstra() and astar_search()."""
+        return cls._from_rows(((u, edges.items()) for u, edges in graph.items()), weighted=True)
+
+    @classmethod
+    def from_weighted_lists(cls, graph):
+        """dict of [(v, w), ...] lists, as taken by bellman_ford() and prims_algorithm()."""
+        return cls._from_rows(graph.items(), weighted=True)
+
+    @classmethod
+    def from_edges(cls, edges, directed=False, vertices=None):
+        """
+        Edge list of (u, v, w) triples, as taken by kruskal_mst().
+
+        Undirected edges are stored in both directions. `vertices` fixes the
+        label order (and adds isolated vertices); by default labels appear in
+        first-seen order.
+        """
+        rows = {u: [] for u in vertices} if vertices is not None else {}
+        for u, v, w in edges:
+            rows.setdefault(u, []).append((v, w))
+            rows.setdefault(v, [])
+            if not directed:
+                rows[v].append((u, w))
+        return cls._from_rows(rows.items(), weighted=True)
+
+    @classmethod
+    def from_matrix(cls, matrix, labels=None):
+        """Dense matrix as taken by floyd_warshall(); inf or None means no edge, the diagonal is skipped."""
+        inf = float("inf")
+        labels = list(range(len(matrix))) if labels is None else labels
+        rows = [(labels[i], [(labels[j], w) for j, w in enumerate(row) if i != j and w is not None and w != inf])
+                for i, row in enumerate(matrix)]
+        return cls._from_rows(rows, weighted=True)
+
+    # --- access ---
+
+    def neighbors(self, u):
+        """Target ids of u's out-edges (a slice of the targets array)."""
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def edges(self, u):
+        """Yields (target id, weight) for u's out-edges; weight is 1 on unweighted graphs."""
+        start, end = self.offsets[u], self.offsets[u + 1]
+        if self.weights is None:
+            for i in range(start, end):
+                yield self.targets[i], 1
+        else:
+            for i in range(start, end):
+                yield self.targets[i], self.weights[i]
+
+    def transpose(self):
+        """The reverse graph (in-edges become out-edges), with the same ids."""
+        n = self.n
+        counts = array("q", [0]) * (n + 1)
+        for v in self.targets:
+            counts[v + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        offsets = array("q", counts)
+        fill = array("q", counts[:n])
+        targets = array("q", [0]) * self.m
+        weights = array("d", [0.0]) * self.m if self.weights is not None else None
+        for u in range(n):
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[i]
+                slot = fill[v]
+                fill[v] += 1
+                targets[slot] = u
+                if weights is not None:
+                    weights[slot] = self.weights[i]
+        return CSRGraph(self.labels, offsets, targets, weights)
+
+    def numpy_arrays(self):
+        """Zero-copy NumPy views (offsets, targets, weights or None)."""
+        if np is None:
+            raise ImportError("numpy is required for numpy_arrays()")
+        weights = None if self.weights is None else np.frombuffer(self.weights, dtype=np.float64)
+        return np.frombuffer(self.offsets, dtype=np.int64), np.frombuffer(self.targets, dtype=np.int64), weights
+
+    def to_dict(self, values, skip=None):
+        """Maps a per-id sequence back to {label: value}, leaving out entries equal to `skip`."""
+        labels = self.labels
+        return {labels[i]: value for i, value in enumerate(values) if skip is None or value != skip}
+
+    def nbytes(self):
+        """Bytes used by the adjacency arrays (excluding the label table)."""
+        total = self.offsets.itemsize * len(self.offsets) + self.targets.itemsize * len(self.targets)
+        if self.weights is not None:
+            total += self.weights.itemsize * len(self.weights)
+        return total
+
+    def __repr__(self):
+        kind = "weighted" if self.weights is not None else "unweighted"
+        return f"CSRGraph(n={self.n}, m={self.m}, {kind})"
+
+
+# Example usage
+# g = CSRGraph.from_weighted_dict({'A': {'B': 1, 'C': 4}, 'B': {'C': 2}, 'C': {}})
+# print(g, list(g.offsets), list(g.targets), list(g.weights))  # Output: CSRGraph(n=3, m=3, weighted) [0, 2, 3, 3] [1, 2, 2] [1.0, 4.0, 2.0]
+# print(g.labels[g.neighbors(g.ids['A'])[1]])  # Output: C
+# print(list(CSRGraph.from_edges([(0, 1, 10), (1, 2, 5)]).neighbors(1)))  # Output: [0, 2]
@@ -52,6 +52,7 @@ The space complexity is O(V) due to the storage required for the stack and the v
 - Recursive DFS utilizing the call stack.
 - Depth-Limited Search which limits the depth of the DFS tree.
 - Iterative Deepening DFS, which combines the space efficiency of BFS with the depth-first nature of DFS.
+- CSR DFS: dfs_csr() runs the same traversal on the int arrays of a CSRGraph (csr_graph_algo.py).
 """
 
 ## 7. Trade-offs
@@ -99,14 +100,36 @@ def dfs(graph, start):
 
     return result
 
+def dfs_csr(graph, start):
+    """
+    Same traversal as dfs() on a CSRGraph (csr_graph_algo.py).
+
+    :param graph: A CSRGraph, e.g. CSRGraph.from_adjacency(adjacency_dict).
+    :param start: The label of the starting node.
+    :return: A list of vertex ids in the order they were visited (graph.labels maps them back).
+    """
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.n)
+    stack = [graph.ids[start]]
+    result = []
+
+    while stack:
+        node = stack.pop()
+        if not visited[node]:
+            visited[node] = 1
+            result.append(node)
+            stack.extend(reversed(targets[offsets[node]:offsets[node + 1]]))
+
+    return result
+
 # Example usage:
-graph_example = {
-    'A': ['B', 'C'],
-    'B': ['D', 'E'],
-    'C': ['F'],
-    'D': [],
-    'E': ['F'],
-    'F': []
-}
-
-print(dfs(graph_example, 'A'))  # Output: ['A', 'C', 'F', 'B', 'E', 'D']
+# graph_example = {
+#     'A': ['B', 'C'],
+#     'B': ['D', 'E'],
+#     'C': ['F'],
+#     'D': [],
+#     'E': ['F'],
+#     'F': []
+# }
+
+# print(dfs(graph_example, 'A'))  # Output: ['A', 'C', 'F', 'B', 'E', 'D']
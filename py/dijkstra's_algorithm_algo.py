@@ -19,6 +19,10 @@ The core idea of Dijkstra's Algorithm is to iteratively select the vertex with t
    - For each neighbor `v` of `u`, calculate the tentative distance from the source to `v` through `u`.
    - If the calculated distance is less than the known distance to `v`, update the distance to `v` and insert `v` into the priority queue.
 4. Repeat until all vertices have been processed and the priority queue is empty.
+
+Point-to-point queries (shortest_path):
+- Stop as soon as the target is popped (settled); its distance is final. Walk the predecessor map back from the target to get the path.
+- Bidirectional: run one search forward from s and one on the reverse graph from t, always advancing the side with the smaller queue head. Every edge relaxed towards a vertex the other side has reached gives a candidate path length mu. Stop when the two queue heads sum to at least mu.
 """
 
 ## 4. Time & Space Complexity
@@ -45,6 +49,8 @@ The core idea of Dijkstra's Algorithm is to iteratively select the vertex with t
 - A* Algorithm: A variant that uses heuristics to improve performance in certain scenarios.
 - Bellman-Ford Algorithm: Used when graphs have negative weight edges.
 - Johnson's Algorithm: Efficient for dense graphs requiring all-pairs shortest paths.
+- CSR Dijkstra: dijkstra_csr() runs on the int arrays of a CSRGraph (csr_graph_algo.py) with list-indexed distances.
+- Early-exit and bidirectional Dijkstra: shortest_path() for single source-target queries, settling only a ball around s (and t).
 """
 
 ## 7. Trade-offs
@@ -92,3 +98,167 @@ def dijkstra(graph, start_vertex):
                 heapq.heappush(priority_queue, (distance, neighbor))
 
     return distances
+
+def dijkstra_csr(graph, start_vertex):
+    """
+    dijkstra() on a weighted CSRGraph (csr_graph_algo.py).
+
+    Returns a list of distances indexed by vertex id; graph.to_dict(distances)
+    gives the same dict as dijkstra().
+    """
+    import heapq
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = [float('infinity')] * graph.n
+    source = graph.ids[start_vertex]
+    distances[source] = 0
+    priority_queue = [(0, source)]
+
+    while priority_queue:
+        current_distance, current_vertex = heapq.heappop(priority_queue)
+        if current_distance > distances[current_vertex]:
+            continue
+
+        for i in range(offsets[current_vertex], offsets[current_vertex + 1]):
+            neighbor = targets[i]
+            distance = current_distance + weights[i]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                heapq.heappush(priority_queue, (distance, neighbor))
+
+    return distances
+
+def reverse_graph(graph):
+    # {u: {v: w}} -> {v: {u: w}}, keeping vertices without incoming edges
+    reverse = {vertex: {} for vertex in graph}
+    for u, edges in graph.items():
+        for v, weight in edges.items():
+            reverse.setdefault(v, {})[u] = weight
+    return reverse
+
+def shortest_path(graph, source, target, bidirectional=False, reverse=None, stats=None):
+    """
+    Shortest source -> target path in a dict-of-dicts graph; returns (distance, path).
+
+    Unlike dijkstra(), the search stops once target is settled. With
+    bidirectional=True a second search runs backwards from target on the
+    reverse graph (pass `reverse` from reverse_graph() to reuse it across
+    queries). Returns (float('infinity'), []) when target is unreachable. If
+    `stats` is a dict, stats["settled"] counts the vertices popped.
+    """
+    import heapq
+    infinity = float('infinity')
+    settled = 0
+
+    if source == target:
+        best, path = 0, [source]
+    elif not bidirectional:
+        distances = {source: 0}
+        previous = {source: None}
+        priority_queue = [(0, source)]
+        best, path = infinity, []
+
+        while priority_queue:
+            current_distance, current_vertex = heapq.heappop(priority_queue)
+            if current_distance > distances[current_vertex]:
+                continue
+            settled += 1
+            if current_vertex == target:
+                best = current_distance
+                path = _walk(previous, target)[::-1]
+                break
+
+            for neighbor, weight in graph[current_vertex].items():
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, infinity):
+                    distances[neighbor] = distance
+                    previous[neighbor] = current_vertex
+                    heapq.heappush(priority_queue, (distance, neighbor))
+    else:
+        if reverse is None:
+            reverse = reverse_graph(graph)
+        adjacency = (graph, reverse)
+        distances = ({source: 0}, {target: 0})
+        previous = ({source: None}, {target: None})
+        queues = ([(0, source)], [(0, target)])
+        best, meeting = infinity, None
+
+        while queues[0] and queues[1]:
+            # Meeting criterion: no shorter path can still be found
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            current_distance, current_vertex = heapq.heappop(queues[side])
+            if current_distance > distances[side][current_vertex]:
+                continue
+            settled += 1
+
+            own, other = distances[side], distances[1 - side]
+            for neighbor, weight in adjacency[side].get(current_vertex, {}).items():
+                distance = current_distance + weight
+                if distance < own.get(neighbor, infinity):
+                    own[neighbor] = distance
+                    previous[side][neighbor] = current_vertex
+                    heapq.heappush(queues[side], (distance, neighbor))
+                if neighbor in other and distance + other[neighbor] < best:
+                    best = distance + other[neighbor]
+                    meeting = neighbor
+
+        if meeting is None:
+            path = []
+        else:
+            best = distances[0][meeting] + distances[1][meeting]
+            path = _walk(previous[0], meeting)[::-1] + _walk(previous[1], meeting)[1:]
+
+    if stats is not None:
+        stats["settled"] = stats.get("settled", 0) + settled
+    return best, path
+
+def _walk(previous, vertex):
+    # Follows a predecessor map from vertex back to the search's root
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = previous[vertex]
+    return path
+
+def benchmark_shortest_path(side=300, queries=20, seed=0):
+    """Vertices settled and time per query on a side x side grid road network: full dijkstra() vs shortest_path()."""
+    import random
+    import time
+
+    rng = random.Random(seed)
+    graph = {(r, c): {} for r in range(side) for c in range(side)}
+    for r, c in graph:
+        for nr, nc in ((r + 1, c), (r, c + 1)):
+            if nr < side and nc < side:
+                weight = rng.uniform(1, 10)
+                graph[(r, c)][(nr, nc)] = weight
+                graph[(nr, nc)][(r, c)] = weight
+    reverse = reverse_graph(graph)
+    vertices = list(graph)
+    # Local queries: targets a few blocks away, as in routing
+    sources = [rng.choice(vertices) for _ in range(queries)]
+    pairs = [(s, (min(side - 1, s[0] + 10), min(side - 1, s[1] + 10))) for s in sources]
+
+    start = time.perf_counter()
+    for s, _ in pairs:
+        dijkstra(graph, s)
+    print(f"dijkstra (full)        {len(graph):>9,} settled  {(time.perf_counter() - start) / queries * 1e3:8.1f} ms/query")
+    for name, bidirectional in (("early exit", False), ("bidirectional", True)):
+        stats = {}
+        start = time.perf_counter()
+        for s, t in pairs:
+            shortest_path(graph, s, t, bidirectional=bidirectional, reverse=reverse, stats=stats)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<22} {stats['settled'] // queries:>9,} settled  {elapsed / queries * 1e3:8.1f} ms/query")
+
+# Example usage:
+# graph = {
+#     'A': {'B': 1, 'C': 4},
+#     'B': {'C': 2, 'D': 5},
+#     'C': {'D': 1},
+#     'D': {}
+# }
+# print(dijkstra(graph, 'A'))  # Output: {'A': 0, 'B': 1, 'C': 3, 'D': 4}
+# print(shortest_path(graph, 'A', 'D', bidirectional=True))  # Output: (4, ['A', 'B', 'C', 'D'])
+# benchmark_shortest_path()
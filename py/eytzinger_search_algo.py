@@ -0,0 +1,234 @@
+# Eytzinger Layout Binary Search Algorithm
+
+## 1. Category / Type
+"""
+Search Algorithm / Cache-friendly static data layout (implicit search trees).
+"""
+
+## 2. Core Idea / Intuition
+"""
+Binary search on a large sorted array jumps around memory: the first probes are n/2, n/4, 3n/4, ... apart, so almost every probe is a cache miss. The probes are however always the same for the top levels, they just live far apart.
+
+The Eytzinger (BFS) layout stores the implicit binary search tree level by level, like a binary heap: the root at index 1, the children of k at 2k and 2k + 1. The first few levels then sit together in a few cache lines, the next level's candidates are adjacent (2k and 2k + 1), and the search becomes a branch-light loop: k = 2k + (b[k] < x).
+
+The blocked (B-tree / S-tree) layout goes further: each node holds B sorted keys that fit in one or two cache lines, and has B + 1 children, so each cache line read eliminates a factor of B + 1 instead of 2.
+"""
+
+## 3. Steps / Flow
+"""
+Build (once, O(n)):
+1. Walk the implicit tree in order (left subtree, node, right subtree) and write the sorted values into the slots in that order.
+2. Remember for each slot the position of its value in the sorted array.
+
+Eytzinger search for the first value >= x:
+1. k = 1; while k <= n: k = 2k + (b[k] < x).
+2. The answer is the last node where we went left: strip the trailing 1-bits of k and one more bit (k >>= trailing_ones(k) + 1).
+3. k == 0 means every value is < x.
+
+Blocked search:
+1. In node k, binary search the B keys for the first key >= x (position j); remember it as a candidate.
+2. Descend to child j of node k, until past the last node. The last candidate is the answer.
+"""
+
+## 4. Time & Space Complexity
+"""
+| Operation | Time      | Space |
+|-----------|-----------|-------|
+| Build     | O(n)      | O(n)  |
+| Search    | O(log n)  | O(1)  |
+
+- Same comparisons as binary search, but O(log n / log B) cache misses instead of O(log n).
+"""
+
+## 5. Use Cases
+"""
+- Read-only sorted key sets probed millions of times (dictionaries, routing tables, database indexes).
+- Large arrays that do not fit in CPU caches.
+- Vectorized batch lookups, where every query runs the same fixed loop.
+"""
+
+## 6. Common Variants
+"""
+- Eytzinger layout with prefetching of the grandchildren 4 levels ahead.
+- S-tree / S+ tree: static B-tree with SIMD search inside each node.
+- van Emde Boas layout: cache-oblivious recursive layout.
+"""
+
+## 7. Trade-offs
+"""
+- Pros: fewer cache misses, branch-free inner loop, same O(log n) comparisons.
+- Cons: static (rebuild on every change), extra array for the original positions, range scans are no longer contiguous.
+- In pure Python the interpreter overhead dominates cache effects; the layout pays off most with vectorized (NumPy) batch search or in compiled code.
+"""
+
+## 8. Pitfalls / Gotchas
+"""
+- The Eytzinger array is 1-based; index 0 is unused.
+- Recovering the answer requires the trailing-ones trick; forgetting the extra shift returns the wrong node.
+- Blocked layouts need padding slots; padding with the maximum value keeps lower bounds correct.
+"""
+
+## 9. Classic Problems
+"""
+- Static dictionary / membership lookup.
+- Lower bound queries on large sorted arrays.
+"""
+
+## 10. Code Implementation (Demo)
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from key_sort_algo import load_module
+
+# The plain search the benchmark compares against
+binary_search = load_module("binary_search_algo.py").binary_search
+
+
+class EytzingerIndex:
+    """
+    Static search index built once from a sorted sequence.
+
+    layout="eytzinger" stores the values in BFS order of the implicit binary
+    search tree; layout="btree" stores them in blocks of `block` keys forming
+    an implicit (block + 1)-ary search tree. search() has the same semantics
+    as binary_search(): the index of x in the original sorted array, or -1.
+    """
+
+    def __init__(self, sorted_arr, layout="eytzinger", block=16):
+        self.n = len(sorted_arr)
+        self.layout = layout
+        if layout == "eytzinger":
+            self._build_eytzinger(sorted_arr)
+        elif layout == "btree":
+            self.block = block
+            self._build_btree(sorted_arr, block)
+        else:
+            raise ValueError(f"unknown layout: {layout!r}")
+
+    def _build_eytzinger(self, arr):
+        n = self.n
+        self.tree = [None] * (n + 1)
+        self.pos = [n] * (n + 1)  # pos[0] = n: "past the end"
+        i = 0
+        k = 1
+        stack = []
+        # Iterative in-order walk of the implicit tree rooted at 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k = 2 * k
+            k = stack.pop()
+            self.tree[k] = arr[i]
+            self.pos[k] = i
+            i += 1
+            k = 2 * k + 1
+
+    def _build_btree(self, arr, block):
+        n = self.n
+        self.nodes = -(-n // block)
+        size = self.nodes * block
+        # Padding slots repeat the maximum so every block stays sorted
+        pad = arr[-1] if n else None
+        self.tree = [pad] * size
+        self.pos = [n - 1] * size
+        i = 0
+        stack = [(0, 0)]  # (node, next child to visit)
+        while stack:
+            node, j = stack.pop()
+            if node >= self.nodes:
+                continue
+            if j > 0 and i < n:
+                slot = node * block + j - 1
+                self.tree[slot] = arr[i]
+                self.pos[slot] = i
+                i += 1
+            # Child j lies between key j - 1 and key j
+            if j < block:
+                stack.append((node, j + 1))
+            stack.append((node * (block + 1) + j + 1, 0))
+
+    def _lower_bound_slot(self, x):
+        """Returns the slot holding the first value >= x, or None if there is none."""
+        if self.layout == "eytzinger":
+            tree, n = self.tree, self.n
+            k = 1
+            while k <= n:
+                k = 2 * k + (tree[k] < x)
+            # Drop the trailing 1-bits (right turns) and the final left turn
+            k >>= ((~k) & (k + 1)).bit_length()
+            return k or None
+
+        tree, block, nodes = self.tree, self.block, self.nodes
+        slot = None
+        k = 0
+        while k < nodes:
+            lo = k * block
+            j = bisect_left(tree, x, lo, lo + block) - lo
+            if j < block:
+                slot = lo + j
+            k = k * (block + 1) + j + 1
+        return slot
+
+    def lower_bound(self, x):
+        """Returns the position in the sorted array of the first value >= x (n if none)."""
+        slot = self._lower_bound_slot(x)
+        return self.n if slot is None else self.pos[slot]
+
+    def search(self, x):
+        """Index of x in the original sorted array, or -1 (like binary_search)."""
+        slot = self._lower_bound_slot(x)
+        if slot is not None and self.tree[slot] == x:
+            return self.pos[slot]
+        return -1
+
+    def batch_lower_bound(self, targets):
+        """Vectorized Eytzinger lower bounds for an array of targets (requires NumPy)."""
+        if np is None or self.layout != "eytzinger":
+            return [self.lower_bound(x) for x in targets]
+        x = np.asarray(targets)
+        tree = np.asarray(self.tree[1:])
+        tree = np.concatenate([tree[:1], tree])  # restore 1-based indexing with a dummy slot
+        pos = np.asarray(self.pos)
+        k = np.ones(len(x), dtype=np.int64)
+        for _ in range(self.n.bit_length()):
+            active = k <= self.n
+            k[active] = 2 * k[active] + (tree[k[active]] < x[active])
+        lowest_zero = ~k & (k + 1)
+        k //= 2 * lowest_zero
+        return pos[k]
+
+
+def benchmark_static_index(n=10_000_000, queries=1_000_000, seed=0):
+    """Prints lookups per second for binary_search and both static layouts on n sorted ints."""
+    import random
+    import time
+
+    rng = random.Random(seed)
+    arr = list(range(0, 2 * n, 2))
+    targets = [rng.randrange(2 * n) for _ in range(queries)]
+
+    candidates = {"binary_search": lambda x: binary_search(arr, x)}
+    for layout in ("eytzinger", "btree"):
+        start = time.perf_counter()
+        index = EytzingerIndex(arr, layout=layout)
+        print(f"build {layout:<10} {time.perf_counter() - start:.2f}s")
+        candidates[layout] = index.search
+
+    for name, search in candidates.items():
+        start = time.perf_counter()
+        for x in targets:
+            search(x)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<14} {queries / elapsed:,.0f} lookups/s")
+
+
+# Example usage
+# index = EytzingerIndex([1, 3, 5, 7, 9, 11])
+# print(index.tree)  # Output: [None, 7, 3, 11, 1, 5, 9]
+# print(index.search(9), index.search(4))  # Output: 4 -1
+# print(EytzingerIndex([1, 3, 5, 7, 9, 11], layout="btree", block=2).lower_bound(6))  # Output: 3
+# benchmark_static_index(n=1_000_000, queries=100_000)
@@ -52,6 +52,7 @@ the algorithm refines the shortest path estimate for each pair of vertices.
 """
 - Johnson's Algorithm: A variant that reduces time complexity for sparse graphs.
 - Transitive Closure: A simplified application of Floyd-Warshall that computes reachability.
+- CSR input: floyd_warshall_csr() builds the matrix from a CSRGraph (csr_graph_algo.py) and relaxes whole rows at once.
 """
 
 ## 7. Trade-offs
@@ -91,3 +92,42 @@ def floyd_warshall(graph):
                 dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
 
     return dist
+
+def floyd_warshall_csr(graph):
+    """
+    All-pairs shortest paths for a weighted CSRGraph (csr_graph_algo.py).
+
+    Returns a V x V matrix indexed by vertex id. With NumPy each k step is one
+    vectorized minimum over the whole matrix; otherwise each row is relaxed
+    with a list comprehension, skipping rows that cannot reach k.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    V = graph.n
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = [[float('inf')] * V for _ in range(V)]
+    for u in range(V):
+        row = dist[u]
+        row[u] = 0
+        for i in range(offsets[u], offsets[u + 1]):
+            row[targets[i]] = min(row[targets[i]], weights[i])
+
+    if np is not None:
+        d = np.array(dist, dtype=np.float64)
+        for k in range(V):
+            np.minimum(d, d[:, k, None] + d[None, k, :], out=d)
+        return d.tolist()
+
+    for k in range(V):
+        row_k = dist[k]
+        for i in range(V):
+            row_i = dist[i]
+            d_ik = row_i[k]
+            if d_ik == float('inf'):
+                continue
+            dist[i] = [a if a <= d_ik + b else d_ik + b for a, b in zip(row_i, row_k)]
+
+    return dist
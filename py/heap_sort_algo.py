@@ -47,6 +47,8 @@ The array is now sorted in ascending order.
 """
 - **Min-Heap Sort**: Uses a min-heap to sort data in descending order.
 - **External Heap Sort**: Used for sorting data that does not fit into memory.
+- **Bottom-Up Heap Sort**: Sifts the hole left by the root straight down to a leaf along the larger children, then climbs back up to place the element, using about half the comparisons.
+- **d-ary Heap Sort**: Gives every node d children (e.g. 4 or 8), making the heap shallower and keeping siblings next to each other in memory.
 """
 
 ## 7. Trade-offs
@@ -102,6 +104,155 @@ def heap_sort(arr):
         heapify(arr, i, 0)
 
 # Example usage
-data = [12, 11, 13, 5, 6, 7]
-heap_sort(data)
-print("Sorted array is", data)
+# data = [12, 11, 13, 5, 6, 7]
+# heap_sort(data)
+# print("Sorted array is", data)
+
+
+def typed_view(buffer, typecode=None):
+    """
+    Returns a flat memoryview of buffer whose items have the given array typecode.
+
+    Shared by the buffer modes of heap, counting and radix sort.
+    """
+    view = memoryview(buffer)
+    typecode = typecode or view.format.lstrip("@=<")
+    if view.format != typecode or view.ndim != 1:
+        view = view.cast("B").cast(typecode)
+    return view
+
+
+def heap_sort_buffer(buffer, typecode=None):
+    """
+    Heap sorts an array.array, memoryview, mmap or NumPy array in place.
+
+    The data is accessed through a typed memoryview (pass `typecode`, e.g.
+    "i" or "d", for untyped buffers such as mmap or bytearray), so it is
+    never copied into a list of Python objects.
+    """
+    with typed_view(buffer, typecode) as view:
+        heap_sort(view)
+    return buffer
+
+
+# Example usage (in-place on a memory-mapped file of int32 values)
+# import mmap
+# with open("values.i32", "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+#     heap_sort_buffer(mm, "i")
+
+
+def heapify_iterative(arr, n, i, lo=0):
+    """
+    Same as heapify(), with the tail recursion turned into a loop.
+
+    The heap of size n starts at arr[lo], so a slice can be heapified in
+    place (introsort's fallback and partial_sort use this).
+    """
+    while True:
+        largest = i
+        left = 2 * i + 1
+        right = 2 * i + 2
+
+        if left < n and arr[lo + i] < arr[lo + left]:
+            largest = left
+
+        if right < n and arr[lo + largest] < arr[lo + right]:
+            largest = right
+
+        if largest == i:
+            return
+        arr[lo + i], arr[lo + largest] = arr[lo + largest], arr[lo + i]
+        i = largest
+
+
+def heap_sort_iterative(arr, lo=0, hi=None):
+    """Heap sorts arr[lo:hi] in place (the whole list by default)."""
+    n = (len(arr) if hi is None else hi) - lo
+    for i in range(n // 2 - 1, -1, -1):
+        heapify_iterative(arr, n, i, lo)
+    for i in range(n - 1, 0, -1):
+        arr[lo + i], arr[lo] = arr[lo], arr[lo + i]
+        heapify_iterative(arr, i, 0, lo)
+    return arr
+
+
+def sift_bottom_up(arr, n, start, value, d=2):
+    """
+    Places value into the hole at index start of a d-ary max heap of size n.
+
+    The hole first walks down to a leaf along the largest child (d - 1
+    comparisons per level, none against value), then value climbs back up
+    from that leaf. Since the element being placed usually belongs near the
+    bottom, the climb is short.
+    """
+    i = start
+    if d == 2:
+        # Binary case without the inner loop over children
+        while True:
+            left = 2 * i + 1
+            if left >= n:
+                break
+            right = left + 1
+            largest = right if right < n and arr[left] < arr[right] else left
+            arr[i] = arr[largest]
+            i = largest
+    else:
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            largest = first
+            for child in range(first + 1, min(first + d, n)):
+                if arr[largest] < arr[child]:
+                    largest = child
+            arr[i] = arr[largest]
+            i = largest
+
+    while i > start:
+        parent = (i - 1) // d
+        if not arr[parent] < value:
+            break
+        arr[i] = arr[parent]
+        i = parent
+    arr[i] = value
+
+
+def heap_sort_bottom_up(arr, d=2):
+    """Sorts arr in place with an iterative bottom-up heap sort on a d-ary heap (d = 2, 4 or 8)."""
+    n = len(arr)
+    for i in range((n - 2) // d, -1, -1):
+        sift_bottom_up(arr, n, i, arr[i], d)
+    for end in range(n - 1, 0, -1):
+        value = arr[end]
+        arr[end] = arr[0]
+        sift_bottom_up(arr, end, 0, value, d)
+    return arr
+
+
+def benchmark_heap_sorts(sizes=(1_000_000, 10_000_000), repeat=1):
+    """Times the recursive heap_sort against the iterative and bottom-up d-ary variants."""
+    import random
+    import time
+
+    variants = {
+        "heap_sort (recursive)": heap_sort,
+        "heap_sort_iterative": heap_sort_iterative,
+        "bottom_up d=2": lambda a: heap_sort_bottom_up(a, 2),
+        "bottom_up d=4": lambda a: heap_sort_bottom_up(a, 4),
+        "bottom_up d=8": lambda a: heap_sort_bottom_up(a, 8),
+    }
+    for n in sizes:
+        data = [random.random() for _ in range(n)]
+        for name, func in variants.items():
+            best = float("inf")
+            for _ in range(repeat):
+                copy = list(data)
+                start = time.perf_counter()
+                func(copy)
+                best = min(best, time.perf_counter() - start)
+            print(f"n={n:>10} {name:<22} {best:.3f}s")
+
+
+# Example usage
+# print(heap_sort_bottom_up([12, 11, 13, 5, 6, 7], d=4))  # Output: [5, 6, 7, 11, 12, 13]
+# benchmark_heap_sorts()
@@ -45,7 +45,7 @@ Given array: [5, 2, 4, 6, 1, 3]
 
 ## 6. Common Variants
 """
-- Binary Insertion Sort: Uses binary search to find the correct location to insert the current element, reducing the number of comparisons in some cases.
+- Binary Insertion Sort: Uses binary search to find the correct location to insert the current element, reducing the number of comparisons in some cases. Moving the tail with one slice assignment also removes the per-element shifting loop.
 - Shell Sort: Generalization of insertion sort that allows the exchange of items that are far apart.
 """
 
@@ -80,3 +80,52 @@ def insertion_sort(arr):
             j -= 1
         arr[j + 1] = key
     return arr
+
+
+from bisect import bisect_right
+
+
+def binary_insertion_sort(arr, lo=0, hi=None):
+    """
+    Sorts arr[lo:hi] in place, finding each insertion point by binary search.
+
+    Comparisons drop to O(n log n) and the shift of the sorted tail is a
+    single slice assignment (one memmove) instead of a Python loop. Stable,
+    since equal keys are inserted after existing ones (bisect_right).
+    """
+    if hi is None:
+        hi = len(arr)
+    for i in range(lo + 1, hi):
+        key = arr[i]
+        if not key < arr[i - 1]:
+            continue  # already in place, common on nearly sorted input
+        pos = bisect_right(arr, key, lo, i - 1)
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = key
+    return arr
+
+
+def insertion_sort_segments(arr, offsets):
+    """
+    Sorts every segment arr[offsets[i]:offsets[i + 1]] in place.
+
+    Meant for many tiny groups stored back to back (e.g. values grouped by
+    key); the loop over segments stays in this one call instead of one sort
+    call per group.
+    """
+    for i in range(len(offsets) - 1):
+        binary_insertion_sort(arr, offsets[i], offsets[i + 1])
+    return arr
+
+
+def insertion_sort_batch(arrays):
+    """Sorts each of many small lists in place with binary insertion sort."""
+    for arr in arrays:
+        binary_insertion_sort(arr)
+    return arrays
+
+
+# Example usage
+# print(binary_insertion_sort([5, 2, 4, 6, 1, 3]))  # Output: [1, 2, 3, 4, 5, 6]
+# print(insertion_sort_segments([3, 1, 2, 9, 8], [0, 3, 5]))  # Output: [1, 2, 3, 8, 9]
+# print(insertion_sort_batch([[2, 1], [3, 1, 2]]))  # Output: [[1, 2], [1, 2, 3]]
@@ -0,0 +1,224 @@
+# Interpolation and Exponential Search Algorithm
+
+## 1. Category / Type
+"""
+Search Algorithm on sorted data (adaptive variants of Binary Search).
+"""
+
+## 2. Core Idea / Intuition
+"""
+Binary search always probes the middle and needs about log2(n) probes whatever the data looks like. When the keys are spread almost evenly (timestamps, sequential IDs), the value itself tells where it should be: a key 30% of the way between the smallest and largest value is probably about 30% into the array. Interpolation search probes there and needs only O(log log n) probes on uniform data.
+
+On skewed data interpolation can degrade to O(n), so a guard falls back to a plain bisection step whenever a probe fails to at least halve the range.
+
+Exponential (galloping) search handles sources whose length is unknown or unbounded (streams, paged storage): probe positions 1, 2, 4, 8, ... until a key >= target is found, then binary search inside the last gap. It costs O(log i) where i is the position of the target, so it is also ideal when the target is near the front.
+"""
+
+## 3. Steps / Flow
+"""
+Guarded interpolation search:
+1. While low <= high and target lies within [arr[low], arr[high]]:
+   - Probe pos = low + (target - arr[low]) * (high - low) // (arr[high] - arr[low]), or the midpoint if the last probe did not halve the range.
+   - Return pos if it matches, else shrink [low, high] past pos.
+
+Exponential search:
+1. bound = 1; while the element at bound exists and is < target: bound *= 2.
+2. Binary search in (bound // 2, min(bound, end)].
+
+Strategy choice:
+1. Sample a few evenly spaced positions and compare each key with the straight line from the first to the last key.
+2. If the largest deviation is a small fraction of n, use interpolation; otherwise use binary search.
+"""
+
+## 4. Time & Space Complexity
+"""
+| Algorithm                  | Best | Average          | Worst    | Space |
+|----------------------------|------|------------------|----------|-------|
+| Interpolation (uniform)    | O(1) | O(log log n)     | O(log n) with guard | O(1) |
+| Exponential                | O(1) | O(log i)         | O(log i) | O(1)  |
+"""
+
+## 5. Use Cases
+"""
+- Sorted timestamps, auto-increment IDs, evenly distributed hashes.
+- Unbounded or streaming sorted sources (log files, paged indexes).
+- Merging / intersecting sorted lists where the next match is usually close.
+"""
+
+## 6. Common Variants
+"""
+- Interpolation-sequential search: one interpolation probe followed by a linear scan.
+- Interpolation-binary hybrids (IBS, TIP): alternate interpolation and bisection steps.
+- Galloping search in TimSort merges.
+"""
+
+## 7. Trade-offs
+"""
+- Interpolation needs numeric keys (arithmetic on values) and gains only on near-uniform data.
+- Each interpolation probe costs a division, more than a bisection step.
+- Exponential search needs no length but does up to twice the probes of binary search for far targets.
+"""
+
+## 8. Pitfalls / Gotchas
+"""
+- Division by zero when arr[low] == arr[high]; check equality first.
+- Without a guard, skewed keys (e.g. exponential growth) make interpolation linear.
+- Targets outside [arr[low], arr[high]] must stop the loop, or the probe falls outside the range.
+"""
+
+## 9. Classic Problems
+"""
+- Search in a Sorted Array of Unknown Size.
+- Finding a record by timestamp in a large log.
+"""
+
+## 10. Code Implementation (Demo)
+def binary_search(arr, target, low=0, high=None):
+    """binary_search() from binary_search_algo.py, returning (index or -1, probes)."""
+    if high is None:
+        high = len(arr) - 1
+    probes = 0
+
+    while low <= high:
+        mid = (low + high) // 2
+        probes += 1
+        if arr[mid] == target:
+            return mid, probes
+        elif arr[mid] < target:
+            low = mid + 1
+        else:
+            high = mid - 1
+
+    return -1, probes
+
+
+def interpolation_search(arr, target):
+    """
+    Guarded interpolation search on sorted numeric keys; returns (index or -1, probes).
+
+    A probe that does not at least halve the remaining range makes the next
+    probe a plain bisection, which caps the worst case at about 2 * log2(n).
+    """
+    low, high = 0, len(arr) - 1
+    probes = 0
+    bisect_next = False
+
+    while low <= high and arr[low] <= target <= arr[high]:
+        if bisect_next or arr[high] == arr[low]:
+            pos = (low + high) // 2
+        else:
+            pos = low + int((target - arr[low]) * (high - low) // (arr[high] - arr[low]))
+        probes += 1
+        size = high - low + 1
+
+        if arr[pos] == target:
+            return pos, probes
+        if arr[pos] < target:
+            low = pos + 1
+        else:
+            high = pos - 1
+        bisect_next = (high - low + 1) * 2 > size
+
+    return -1, probes
+
+
+def exponential_search(source, target):
+    """
+    Galloping search; returns (index or -1, probes).
+
+    `source` is a sorted sequence, or a callable get(i) returning the i-th
+    key or None past the end, for sources whose length is unknown.
+    """
+    if callable(source):
+        get = source
+    else:
+        def get(i):
+            return source[i] if i < len(source) else None
+
+    probes = 1
+    first = get(0)
+    if first is None:
+        return -1, probes
+    if first == target:
+        return 0, probes
+
+    bound = 1
+    while True:
+        value = get(bound)
+        probes += 1
+        if value is None or not value < target:
+            break
+        bound *= 2
+
+    # Binary search in (bound // 2, bound] for the end of the sequence or the target
+    low, high = bound // 2 + 1, bound
+    while low <= high:
+        mid = (low + high) // 2
+        value = get(mid)
+        probes += 1
+        if value is None or target < value:
+            high = mid - 1
+        elif value < target:
+            low = mid + 1
+        else:
+            return mid, probes
+    return -1, probes
+
+
+def choose_strategy(arr, sample_size=32, tolerance=0.01):
+    """
+    Returns "interpolation" if the keys look uniform enough, else "binary".
+
+    Compares sample_size evenly spaced keys with the straight line between
+    the first and last key; uniform means every sampled key's predicted
+    position is within tolerance * n of its real position.
+    """
+    n = len(arr)
+    if n < 2:
+        return "binary"
+    first, last = arr[0], arr[-1]
+    try:
+        span = last - first
+    except TypeError:
+        return "binary"  # non-numeric keys
+    if span == 0:
+        return "binary"
+
+    step = max(1, (n - 1) // sample_size)
+    worst = 0
+    for i in range(0, n, step):
+        predicted = (arr[i] - first) / span * (n - 1)
+        worst = max(worst, abs(predicted - i))
+    return "interpolation" if worst <= tolerance * n else "binary"
+
+
+class AdaptiveSearcher:
+    """Searches a sorted array with the strategy picked from a sample of its keys, and counts probes."""
+
+    def __init__(self, arr, sample_size=32, tolerance=0.01):
+        self.arr = arr
+        self.strategy = choose_strategy(arr, sample_size, tolerance)
+        self.queries = 0
+        self.total_probes = 0
+
+    def search(self, target):
+        """Returns (index or -1, probes used by this query)."""
+        if self.strategy == "interpolation":
+            index, probes = interpolation_search(self.arr, target)
+        else:
+            index, probes = binary_search(self.arr, target)
+        self.queries += 1
+        self.total_probes += probes
+        return index, probes
+
+    def average_probes(self):
+        return self.total_probes / self.queries if self.queries else 0.0
+
+
+# Example usage
+# timestamps = list(range(1_600_000_000, 1_600_000_000 + 10_000_000, 10))
+# searcher = AdaptiveSearcher(timestamps)
+# print(searcher.strategy)  # Output: interpolation
+# print(searcher.search(1_600_123_450))  # Output: (12345, 1)
+# print(binary_search(timestamps, 1_600_123_450))  # Output: (12345, 18)
+# print(exponential_search(lambda i: 3 * i if i < 1000 else None, 27))  # Output: (9, 9)
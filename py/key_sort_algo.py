@@ -0,0 +1,159 @@
+# Key-Based Sorting (Decorate-Sort-Undecorate) Algorithm
+
+## 1. Category / Type
+"""
+Sorting technique / adapter (Schwartzian transform) that works with any sorting algorithm.
+"""
+
+## 2. Core Idea / Intuition
+"""
+Sorting records by a field with a plain sort means either wrapping every record or calling the key function inside every comparison, i.e. O(n log n) key calls. Decorate-Sort-Undecorate computes each key exactly once, sorts the keys together with the original positions, and then reads the records back in the sorted order.
+
+Pairing every key with its original index also makes any algorithm stable: no two decorated items compare equal, so an unstable sort (Quick Sort, Heap Sort) can never swap records with equal keys.
+"""
+
+## 3. Steps / Flow
+"""
+1. Decorate: compute keys = [key(x) for x in arr] (one call per element).
+2. Sort the positions 0..n-1 by (keys[i], i) with the chosen engine.
+   - Comparison engines sort (key, index) pairs.
+   - Integer engines (counting, radix) sort the indices by their integer key directly.
+3. Undecorate: output [arr[i] for i in sorted positions].
+4. For reverse=True, sort by (key, -index) and reverse the result, which keeps equal keys in their original order.
+"""
+
+## 4. Time & Space Complexity
+"""
+| Best         | Average      | Worst        | Space |
+|--------------|--------------|--------------|-------|
+| engine + O(n)| engine + O(n)| engine + O(n)| O(n)  |
+
+- Exactly n key calls, independent of the engine.
+- O(n) extra memory for the keys and positions.
+"""
+
+## 5. Use Cases
+"""
+- Sorting records by a field or a computed value (e.g. lower-cased names).
+- Making unstable sorts stable.
+- Reusing integer-only sorts (counting, radix) for records with small integer keys.
+"""
+
+## 6. Common Variants
+"""
+- Schwartzian transform: the Perl idiom map-sort-map.
+- Argsort: return the sorted positions instead of the records.
+- Comparison-key functions (functools.cmp_to_key) when only a comparator is available.
+"""
+
+## 7. Trade-offs
+"""
+- Pros: one key call per element, stability for free, records are never compared.
+- Cons: O(n) extra memory for the decorated keys; the key must be totally ordered.
+"""
+
+## 8. Pitfalls / Gotchas
+"""
+- Reversing a stably sorted list flips equal keys; negate the tiebreaker index instead.
+- Keys of mixed types (e.g. None and int) raise TypeError in Python 3.
+- Integer engines need integer keys; use a comparison engine for anything else.
+"""
+
+## 9. Classic Problems
+"""
+- Sort employees by department, then by salary.
+- Sort strings case-insensitively while keeping the original strings.
+"""
+
+## 10. Code Implementation (Demo)
+import importlib.util
+import os
+
+# engine name -> (module file in this folder, function name, engine kind)
+SORT_ENGINES = {
+    "bubble": ("bubble_sort_algo.py", "bubble_sort", "comparison"),
+    "selection": ("selection_sort_algo.py", "selection_sort", "comparison"),
+    "insertion": ("insertion_sort_algo.py", "insertion_sort", "comparison"),
+    "merge": ("merge_sort_algo.py", "merge_sort", "comparison"),
+    "quick": ("quick_sort_algo.py", "quick_sort", "comparison"),
+    "introsort": ("quick_sort_algo.py", "introsort", "comparison"),
+    "heap": ("heap_sort_algo.py", "heap_sort", "comparison"),
+    "timsort": ("timsort_algo.py", "natural_merge_sort", "comparison"),
+    # bucket_sort needs arithmetic on the values; sample_sort is its comparison-based mode
+    "bucket": ("bucket_sort_algo.py", "sample_sort", "comparison"),
+    "counting": ("counting_sort_algo.py", "adaptive_counting_sort", "integer"),
+    "radix": ("radix_sort_algo.py", "radix_sort_bytes", "integer"),
+}
+
+_loaded_modules = {}
+
+
+def load_module(filename):
+    """
+    Loads a module of this folder by file name, once.
+
+    Several files are not importable names (e.g. "dijkstra's_algorithm_algo.py"),
+    so every module that needs a sibling goes through this loader. They get
+    it with `from key_sort_algo import load_module`, which resolves because
+    the folder of a script is on sys.path; no module here changes sys.path.
+    """
+    module = _loaded_modules.get(filename)
+    if module is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        spec = importlib.util.spec_from_file_location(filename[:-3], path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _loaded_modules[filename] = module
+    return module
+
+
+def load_sort_engine(name):
+    """Returns (function, kind) for a registered engine, loading its file on first use."""
+    filename, func_name, kind = SORT_ENGINES[name]
+    return getattr(load_module(filename), func_name), kind
+
+
+def argsort(arr, key=None, reverse=False, engine="merge"):
+    """Returns the positions of arr in stable sorted order, calling key once per element."""
+    func, kind = load_sort_engine(engine)
+    keys = list(arr) if key is None else [key(item) for item in arr]
+    n = len(keys)
+    sign = -1 if reverse else 1
+
+    if kind == "integer":
+        if reverse:
+            keys = [-k for k in keys]
+        if engine == "counting":
+            order, _ = func(range(n), key=keys.__getitem__)
+            return order
+        # Radix: pack (key, index) into one integer so ties keep input order
+        packed = [k * n + i for i, k in enumerate(keys)]
+        bits = max((abs(p).bit_length() for p in packed), default=0) + 1
+        return [p % n for p in func(packed, kind="int", width=(bits + 7) // 8)]
+
+    decorated = [(k, sign * i) for i, k in enumerate(keys)]
+    result = func(decorated)
+    if result is None:  # in-place engines such as heap_sort
+        result = decorated
+    order = [sign * i for _, i in result]
+    if reverse:
+        order.reverse()
+    return order
+
+
+def sort_by(arr, key=None, reverse=False, engine="merge"):
+    """
+    Returns a new stably sorted list, like sorted(arr, key=key, reverse=reverse).
+
+    `engine` picks any algorithm from SORT_ENGINES. Each key is computed
+    once and records themselves are never compared.
+    """
+    return [arr[i] for i in argsort(arr, key=key, reverse=reverse, engine=engine)]
+
+
+# Example usage
+# people = [("ann", 31), ("bob", 25), ("cid", 31), ("dee", 19)]
+# print(sort_by(people, key=lambda p: p[1], engine="heap"))
+# # Output: [('dee', 19), ('bob', 25), ('ann', 31), ('cid', 31)]
+# print(sort_by(people, key=lambda p: p[1], reverse=True, engine="counting"))
+# # Output: [('ann', 31), ('cid', 31), ('bob', 25), ('dee', 19)]
@@ -41,6 +41,7 @@ The core idea of Kruskal's Algorithm is to sort all the edges of the graph in no
 """
 - Prim's Algorithm: Another popular algorithm for finding the minimum spanning tree, which grows the MST one vertex at a time.
 - Borůvka's Algorithm: A lesser-known but effective algorithm that works by adding the cheapest edge from each component.
+- CSR Kruskal: kruskal_csr() sorts the edge indices of a CSRGraph (csr_graph_algo.py) and uses flat union-find arrays.
 """
 
 ## 7. Trade-offs
@@ -103,9 +104,11 @@ def kruskal_mst(graph):
     # Step 1: Sort all the edges in non-decreasing order of their weight
     graph = sorted(graph, key=lambda item: item[2])
 
-    subsets = [Subset(v, 0) for v in range(len(graph))]
+    # One subset per vertex (vertices are numbered 0..V-1), not per edge
+    V = max(max(u, v) for u, v, _ in graph) + 1 if graph else 0
+    subsets = [Subset(v, 0) for v in range(V)]
 
-    while e < len(graph) - 1:
+    while e < V - 1 and i < len(graph):
         u, v, w = graph[i]
         i += 1
         x = find(subsets, u)
@@ -118,15 +121,64 @@ def kruskal_mst(graph):
 
     return result
 
+def kruskal_csr(graph):
+    """
+    Kruskal's MST on a weighted CSRGraph (csr_graph_algo.py), e.g. CSRGraph.from_edges(edges).
+
+    Union-find lives in two flat lists indexed by vertex id instead of Subset
+    objects, and edges are sorted as indices into the weights array (NumPy
+    argsort when available). Both directions of an undirected edge are
+    stored; the second one is simply rejected by find(). Returns a minimum
+    spanning forest as (u id, v id, weight) tuples.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = graph.n
+    sources = [u for u in range(n) for _ in range(offsets[u + 1] - offsets[u])]
+    if np is not None:
+        order = np.argsort(np.frombuffer(weights, dtype=np.float64), kind="stable").tolist()
+    else:
+        order = sorted(range(len(weights)), key=weights.__getitem__)
+
+    parent = list(range(n))
+    rank = [0] * n
+
+    def find(i):
+        # Path halving
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    result = []
+    for edge in order:
+        u, v = sources[edge], targets[edge]
+        x, y = find(u), find(v)
+        if x != y:
+            result.append((u, v, weights[edge]))
+            if rank[x] < rank[y]:
+                x, y = y, x
+            parent[y] = x
+            if rank[x] == rank[y]:
+                rank[x] += 1
+            if len(result) == n - 1:
+                break
+
+    return result
+
 # Example usage:
-edges = [
-    (0, 1, 10),
-    (0, 2, 6),
-    (0, 3, 5),
-    (1, 3, 15),
-    (2, 3, 4)
-]
-
-mst = kruskal_mst(edges)
-for u, v, weight in mst:
-    print(f"Edge: {u}-{v} Weight: {weight}")
+# edges = [
+#     (0, 1, 10),
+#     (0, 2, 6),
+#     (0, 3, 5),
+#     (1, 3, 15),
+#     (2, 3, 4)
+# ]
+
+# mst = kruskal_mst(edges)
+# for u, v, weight in mst:
+#     print(f"Edge: {u}-{v} Weight: {weight}")
@@ -0,0 +1,230 @@
+# Learned Index (Piecewise Linear Model) Algorithm
+
+## 1. Category / Type
+"""
+Search Algorithm / Index Data Structure (learned index: model prediction + bounded Binary Search).
+"""
+
+## 2. Core Idea / Intuition
+"""
+A sorted array already defines a function key -> position (its cumulative distribution). Binary search "learns" nothing about it and pays log2(n) probes every time. A learned index fits a small model to that function and uses it to jump almost straight to the right position.
+
+Here the model is a piecewise linear approximation (PLA) with a guaranteed maximum error epsilon: every distinct key's first position is within epsilon of the prediction of its segment. A lookup finds the segment (binary search over a short list of segment start keys), predicts a position, and finishes with a binary search limited to the 2 * epsilon + 1 slots around the prediction.
+
+Segments are fitted greedily in one pass with a "shrinking cone": starting from the segment's first point, each new point narrows the range of slopes that keep all points within epsilon. When the range becomes empty, the segment is closed and a new one starts.
+"""
+
+## 3. Steps / Flow
+"""
+Build (one pass over the sorted keys):
+1. Start a segment at the first key (k0, i0) with slope range [0, inf).
+2. For each next distinct key (k, i): the slope must lie in [(i - eps - i0) / (k - k0), (i + eps - i0) / (k - k0)]. Intersect with the current range.
+3. If the intersection is empty, close the segment with the middle slope and start a new one at (k, i).
+
+Lookup of x:
+1. seg = last segment whose first key <= x.
+2. pred = i0 + slope * (x - k0).
+3. Binary search arr[pred - eps - 1 : pred + eps + 2] for the first key >= x.
+4. Check the window edges; if the answer lies outside (possible for keys absent from the array or long runs of duplicates), widen with exponential search.
+"""
+
+## 4. Time & Space Complexity
+"""
+| Operation | Time                              | Space          |
+|-----------|-----------------------------------|----------------|
+| Build     | O(n)                              | O(segments)    |
+| Lookup    | O(log segments + log eps)         | O(1)           |
+
+- Smooth key distributions need very few segments (one for evenly spaced keys), so the index is tiny compared to the data.
+"""
+
+## 5. Use Cases
+"""
+- Read-only sorted key sets with hundreds of millions of entries (time series, IDs, geo cells).
+- Secondary indexes where memory for a B-tree is too expensive.
+- Compact serialized indexes shipped alongside sorted data files.
+"""
+
+## 6. Common Variants
+"""
+- RMI (Recursive Model Index): a hierarchy of models, the top one picks the model below.
+- PGM-index: optimal PLA segments, built recursively on the segment keys.
+- RadixSpline: spline points plus a radix table for the first lookup step.
+"""
+
+## 7. Trade-offs
+"""
+- Pros: index size proportional to the number of segments, not keys; predictable bounded last-mile search.
+- Cons: static (inserts need a rebuild or buffer), numeric keys only, adversarial distributions need many segments.
+- epsilon trades index size (larger eps, fewer segments) against the last-mile search cost.
+"""
+
+## 8. Pitfalls / Gotchas
+"""
+- The error bound holds for keys present in the array; missing keys and duplicates need an edge check after the window search.
+- Floating-point predictions must be clamped to [0, n - 1].
+- Keys must be sorted; the model silently returns garbage on unsorted data.
+"""
+
+## 9. Classic Problems
+"""
+- Point lookups and lower bounds on huge static sorted arrays.
+- Range queries: lower bound of the start key, then scan.
+"""
+
+## 10. Code Implementation (Demo)
+import struct
+from bisect import bisect_right
+
+from key_sort_algo import load_module
+
+# lower_bound() is the bounded last-mile search; binary_search() the benchmark baseline
+_binary_search = load_module("binary_search_algo.py")
+lower_bound = _binary_search.lower_bound
+binary_search = _binary_search.binary_search
+
+
+def fit_segments(keys, eps):
+    """
+    Fits a piecewise linear model to sorted numeric keys in one pass.
+
+    Returns a list of (first_key, first_pos, slope) such that, for every
+    distinct key, first_pos + slope * (key - first_key) is within eps of the
+    key's first position.
+    """
+    segments = []
+    n = len(keys)
+    if n == 0:
+        return segments
+
+    k0, i0 = keys[0], 0
+    lo_slope, hi_slope = 0.0, float("inf")
+    prev = keys[0]
+    for i in range(1, n):
+        k = keys[i]
+        if k == prev:
+            continue  # only the first occurrence of a key is modelled
+        prev = k
+        dx = k - k0
+        lo = (i - eps - i0) / dx
+        hi = (i + eps - i0) / dx
+        if lo > hi_slope or hi < lo_slope:
+            slope = lo_slope if hi_slope == float("inf") else (lo_slope + hi_slope) / 2
+            segments.append((k0, i0, slope))
+            k0, i0 = k, i
+            lo_slope, hi_slope = 0.0, float("inf")
+        else:
+            lo_slope = max(lo_slope, lo)
+            hi_slope = min(hi_slope, hi)
+    slope = lo_slope if hi_slope == float("inf") else (lo_slope + hi_slope) / 2
+    segments.append((k0, i0, slope))
+    return segments
+
+
+class LearnedIndex:
+    """
+    Static learned index over a sorted numeric array.
+
+    lower_bound(x) and search(x) have the semantics of lower_bound() and
+    binary_search() in binary_search_algo.py; the final step is a binary
+    search bounded to the model's error window of 2 * eps + 1 slots.
+    """
+
+    _HEADER = struct.Struct("<QQ")
+    _SEGMENT = struct.Struct("<dQd")
+
+    def __init__(self, arr, eps=32, segments=None):
+        self.arr = arr
+        self.eps = eps
+        self.segments = fit_segments(arr, eps) if segments is None else segments
+        self._first_keys = [s[0] for s in self.segments]
+
+    def predict(self, x):
+        """Predicted position of x, clamped to the array bounds."""
+        j = bisect_right(self._first_keys, x) - 1
+        if j < 0:
+            return 0
+        k0, i0, slope = self.segments[j]
+        pos = int(i0 + slope * (x - k0))
+        return min(max(pos, 0), len(self.arr) - 1)
+
+    def lower_bound(self, x):
+        arr, n = self.arr, len(self.arr)
+        if n == 0:
+            return 0
+        pred = self.predict(x)
+        low = max(0, pred - self.eps - 1)
+        high = min(n, pred + self.eps + 2)
+        i = lower_bound(arr, x, low, high)
+
+        # The window is exact for stored keys; otherwise widen it by galloping
+        step = high - low
+        while low > 0 and i == low and not arr[low - 1] < x:
+            high, low = low, max(0, low - step)
+            step *= 2
+            i = lower_bound(arr, x, low, high)
+        while i == high and high < n:
+            low, high = high, min(n, high + step)
+            step *= 2
+            i = lower_bound(arr, x, low, high)
+        return i
+
+    def search(self, x):
+        """Index of x in the array, or -1 (like binary_search)."""
+        i = self.lower_bound(x)
+        if i < len(self.arr) and self.arr[i] == x:
+            return i
+        return -1
+
+    def to_bytes(self):
+        """Serializes the model (not the data): 16-byte header + 24 bytes per segment."""
+        parts = [self._HEADER.pack(self.eps, len(self.segments))]
+        parts.extend(self._SEGMENT.pack(float(k0), i0, slope) for k0, i0, slope in self.segments)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data, arr):
+        eps, count = cls._HEADER.unpack_from(data, 0)
+        size = cls._SEGMENT.size
+        offset = cls._HEADER.size
+        segments = [cls._SEGMENT.unpack_from(data, offset + j * size) for j in range(count)]
+        return cls(arr, eps=eps, segments=segments)
+
+
+def benchmark_learned_index(n=10_000_000, queries=200_000, eps=32, seed=0):
+    """Compares build size and lookup time of LearnedIndex with plain binary_search."""
+    import random
+    import time
+    from array import array
+
+    rng = random.Random(seed)
+    # Near-uniform keys with jitter, e.g. event timestamps
+    keys = array("q", sorted(rng.randrange(0, 100 * n) for _ in range(n)))
+
+    start = time.perf_counter()
+    index = LearnedIndex(keys, eps=eps)
+    build = time.perf_counter() - start
+    targets = [keys[rng.randrange(n)] for _ in range(queries)]
+
+    timings = {}
+    for name, search in (("binary_search", lambda x: binary_search(keys, x)), ("learned", index.search)):
+        start = time.perf_counter()
+        for x in targets:
+            search(x)
+        timings[name] = time.perf_counter() - start
+
+    size = len(index.to_bytes())
+    print(f"sorted array: {n:,} keys, {keys.itemsize * n / 2**20:.1f} MiB")
+    print(f"learned index: {len(index.segments):,} segments, {size / 1024:.1f} KiB "
+          f"({size / (keys.itemsize * n):.2%} of the data), built in {build:.2f}s")
+    for name, elapsed in timings.items():
+        print(f"{name:<14} {elapsed / queries * 1e6:.2f} us/lookup")
+
+
+# Example usage
+# keys = list(range(0, 1_000_000, 7))
+# index = LearnedIndex(keys, eps=8)
+# print(len(index.segments), index.search(700), index.search(701))  # Output: 1 100 -1
+# restored = LearnedIndex.from_bytes(index.to_bytes(), keys)
+# print(restored.lower_bound(701))  # Output: 101
+# benchmark_learned_index(n=1_000_000)
@@ -41,7 +41,9 @@ Key Intuition:
 
 ## 6. Common Variants
 """
-- Bottom-Up Merge Sort: An iterative version that avoids the recursive overhead by using a loop to iteratively merge sublists.
+- Bottom-Up Merge Sort: An iterative version that avoids the recursive overhead by using a loop to iteratively merge sublists. Alternating between the input and one auxiliary buffer (ping-pong) removes all slicing and per-level result lists.
+- External Merge Sort: Sorts memory-sized runs, spills them to disk and streams a k-way merge of the runs, for data larger than RAM.
+- Parallel Merge Sort: Splits the input into per-core chunks, sorts each chunk in a separate process and k-way merges the sorted runs.
 """
 
 ## 7. Trade-offs
@@ -89,3 +91,288 @@ def merge_sort(arr):
     right_half = merge_sort(arr[mid:])
 
     return merge(left_half, right_half)
+
+
+def merge_sort_bottom_up(arr):
+    """
+    Sorts arr in place with a bottom-up merge sort using exactly n extra slots.
+
+    Each pass merges pairs of runs of length `width` from one buffer into the
+    other, then the buffers swap roles, so nothing is sliced and no per-level
+    lists are built. Pairs that are already in order (last of the left run
+    <= first of the right run) are copied without comparisons.
+    """
+    n = len(arr)
+    if n <= 1:
+        return arr
+
+    src, dst = arr, [None] * n
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid >= hi or not src[mid] < src[mid - 1]:
+                for k in range(lo, hi):
+                    dst[k] = src[k]
+                continue
+
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if src[j] < src[i]:
+                    dst[k] = src[j]
+                    j += 1
+                else:
+                    dst[k] = src[i]
+                    i += 1
+                k += 1
+            while i < mid:
+                dst[k] = src[i]
+                i += 1
+                k += 1
+            while j < hi:
+                dst[k] = src[j]
+                j += 1
+                k += 1
+        src, dst = dst, src
+        width *= 2
+
+    if src is not arr:
+        arr[:] = src
+    return arr
+
+
+def _sort_shared_chunk(shm_name, typecode, lo, hi):
+    """Worker: sorts the slice [lo, hi) of a shared-memory buffer in place."""
+    from array import array
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf.cast(typecode)
+        try:
+            view[lo:hi] = array(typecode, merge_sort(view[lo:hi].tolist()))
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def _infer_typecode(arr):
+    """Returns "q" for int64 values and "d" for floats (or ints and floats that round-trip through a float)."""
+    if all(type(v) is int for v in arr):
+        if arr and not (-2**63 <= min(arr) and max(arr) < 2**63):
+            raise OverflowError("parallel_merge_sort: int values must fit in 64 bits")
+        return "q"
+    for v in arr:
+        if type(v) is int:
+            if float(v) != v:
+                raise ValueError(f"parallel_merge_sort: {v} cannot be stored exactly next to floats")
+        elif type(v) is not float:
+            raise TypeError(f"parallel_merge_sort sorts ints or floats, not {type(v).__name__}")
+    return "d"
+
+
+def parallel_merge_sort(arr, workers=None, typecode=None):
+    """
+    Sorts a list of numbers using one process per chunk.
+
+    The values are packed once into a multiprocessing.shared_memory buffer.
+    `typecode` is as in the array module; by default it is "q" for ints and
+    "d" for floats, so values come back with the type they went in with
+    (mixed ints and floats come back as floats). An explicit typecode that
+    cannot hold the values exactly raises ValueError.
+    Each worker attaches to the buffer by name and sorts its own chunk in
+    place, so only the chunk bounds travel through the pool's pipes. The
+    sorted runs are then combined with a heap-based k-way merge.
+    """
+    import heapq
+    import os
+    from array import array
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+    if n <= 1 or workers == 1:
+        return merge_sort(list(arr))
+
+    if typecode is None:
+        data = array(_infer_typecode(arr), arr)  # exact by construction
+    else:
+        data = array(typecode, arr)
+        for stored, value in zip(data, arr):
+            # NaN != NaN, so compare NaNs by being NaN
+            if stored != value and not (stored != stored and value != value):
+                raise ValueError(f"{value!r} does not round-trip through typecode {typecode!r}")
+    typecode = data.typecode
+    shm = shared_memory.SharedMemory(create=True, size=max(1, n * data.itemsize))
+    try:
+        # Every memoryview must be released before close(), even on errors,
+        # or close() raises BufferError and unlink() never runs
+        view = shm.buf.cast(typecode)
+        try:
+            view[:] = data
+            del data
+
+            chunk = -(-n // workers)
+            bounds = [(lo, min(lo + chunk, n)) for lo in range(0, n, chunk)]
+            with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+                futures = [pool.submit(_sort_shared_chunk, shm.name, typecode, lo, hi) for lo, hi in bounds]
+                for future in futures:
+                    future.result()
+
+            runs = [view[lo:hi] for lo, hi in bounds]
+            try:
+                return list(heapq.merge(*runs))
+            finally:
+                for run in runs:
+                    run.release()
+        finally:
+            view.release()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# Example usage (run under `if __name__ == "__main__":` on spawn-based platforms)
+# import random
+# data = [random.random() for _ in range(1_000_000)]
+# print(parallel_merge_sort(data) == sorted(data))  # Output: True
+
+
+def _read_run(path, record_size, block_size):
+    """
+    Yields the records of a run file, mapping it one window of about
+    block_size bytes (whole records) at a time.
+
+    Only the current window is mapped, so pages already consumed are
+    released instead of staying resident until the whole run is merged.
+    mmap offsets must be multiples of the allocation granularity, so each
+    map starts at the window rounded down to it and the records are sliced
+    from there: a map is at most block_size + ALLOCATIONGRANULARITY bytes,
+    whatever the record size.
+    """
+    import mmap
+
+    granularity = mmap.ALLOCATIONGRANULARITY
+    window = max(record_size, block_size - block_size % record_size)
+    with open(path, "rb") as f:
+        size = f.seek(0, 2)
+        for start in range(0, size, window):
+            length = min(window, size - start)
+            skip = start % granularity
+            with mmap.mmap(f.fileno(), skip + length, access=mmap.ACCESS_READ, offset=start - skip) as mm:
+                for i in range(skip, skip + length, record_size):
+                    yield mm[i:i + record_size]
+
+
+def _merge_runs(paths, out, record_size, block_size, key):
+    """Streams a heap-based k-way merge of sorted run files into the open file `out`."""
+    import heapq
+
+    readers = [_read_run(path, record_size, block_size) for path in paths]
+    buffer = bytearray()
+    for record in heapq.merge(*readers, key=key):
+        buffer += record
+        if len(buffer) >= block_size:
+            out.write(buffer)
+            buffer.clear()
+    out.write(buffer)
+
+
+def external_merge_sort(input_path, output_path, record_size, key=None,
+                        memory_limit=64 * 1024 * 1024, fan_in=16,
+                        block_size=1024 * 1024, tmp_dir=None):
+    """
+    Sorts a file of fixed-width records that may not fit in memory.
+
+    Phase 1 reads records in block_size reads until a run's in-memory cost
+    (one bytes object per record, its key if any, and the list slots used by
+    merge_sort_bottom_up) reaches `memory_limit`, sorts them and spills each
+    sorted run to a temporary file. Phase 2 merges at most `fan_in` runs at a
+    time with a heap-based k-way merge, mapping one block of each run at a
+    time, repeating until a single pass writes `output_path`. Records
+    compare as raw bytes unless a `key` function is given. Peak memory is
+    about memory_limit in phase 1 and (fan_in + 1) * block_size (plus one
+    mmap allocation granularity per run) in phase 2, independent of the input
+    size.
+    Returns the number of runs produced by phase 1.
+    """
+    import os
+    import sys
+    import tempfile
+
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    read_size = max(record_size, block_size - block_size % record_size)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as workdir:
+        runs = []
+        with open(input_path, "rb") as f:
+            records_per_run = None
+            pending = b""
+            while True:
+                records = []
+                while records_per_run is None or len(records) < records_per_run:
+                    data = pending or f.read(read_size)
+                    pending = b""
+                    if not data:
+                        break
+                    if len(data) % record_size:
+                        raise ValueError("input size is not a multiple of record_size")
+                    if records_per_run is None:
+                        # Real cost of one record: the bytes object, plus the
+                        # (key, record) tuple and key when sorting by key,
+                        # plus a slot in the list and in the sort buffer
+                        sample = data[:record_size]
+                        cost = sys.getsizeof(sample) + 2 * 8
+                        if key is not None:
+                            cost += sys.getsizeof((None, None)) + sys.getsizeof(key(sample))
+                        records_per_run = max(1, memory_limit // cost)
+                    take = min(len(data), (records_per_run - len(records)) * record_size)
+                    records.extend(data[i:i + record_size] for i in range(0, take, record_size))
+                    pending = data[take:]
+                    del data
+                if not records:
+                    break
+
+                if key is None:
+                    merge_sort_bottom_up(records)
+                else:
+                    records = [(key(rec), rec) for rec in records]
+                    merge_sort_bottom_up(records)
+                    for i, (_, rec) in enumerate(records):
+                        records[i] = rec
+                path = os.path.join(workdir, f"run{len(runs)}")
+                with open(path, "wb") as run:
+                    for i in range(0, len(records), read_size // record_size):
+                        run.write(b"".join(records[i:i + read_size // record_size]))
+                del records
+                runs.append(path)
+
+        initial_runs = len(runs)
+        generation = 0
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                path = os.path.join(workdir, f"merge{generation}_{i // fan_in}")
+                with open(path, "wb") as out:
+                    _merge_runs(runs[i:i + fan_in], out, record_size, block_size, key)
+                for old in runs[i:i + fan_in]:
+                    os.remove(old)
+                merged.append(path)
+            runs = merged
+            generation += 1
+
+        with open(output_path, "wb") as out:
+            _merge_runs(runs, out, record_size, block_size, key)
+
+    return initial_runs
+
+
+# Example usage
+# import os
+# with open("records.bin", "wb") as f:
+#     f.write(os.urandom(16 * 1_000_000))
+# external_merge_sort("records.bin", "sorted.bin", record_size=16, memory_limit=1024 * 1024)
@@ -42,6 +42,7 @@ Prim's Algorithm is used in network design, such as designing the least costly n
 """
 - Kruskal's Algorithm: Another algorithm to find the MST, but it sorts all edges first and adds them one by one.
 - Reverse-delete Algorithm: Starts with all edges and removes the largest edges one by one without disconnecting the graph.
+- CSR Prim: prims_csr() runs on the int arrays of a CSRGraph (csr_graph_algo.py) with a bytearray for visited vertices.
 """
 
 ## 7. Trade-offs
@@ -88,6 +89,32 @@ def prims_algorithm(graph, start_vertex):
 
     return mst_edges
 
+def prims_csr(graph, start_vertex):
+    # Same as prims_algorithm() on a weighted, undirected CSRGraph (csr_graph_algo.py); edges are (parent id, id, weight)
+    import heapq
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    mst_edges = []
+    visited = bytearray(graph.n)
+    remaining = graph.n
+    min_heap = [(0, graph.ids[start_vertex], -1)]  # (weight, vertex, parent)
+
+    while min_heap and remaining:
+        weight, current_vertex, parent = heapq.heappop(min_heap)
+
+        if not visited[current_vertex]:
+            visited[current_vertex] = 1
+            remaining -= 1
+            if parent != -1:
+                mst_edges.append((parent, current_vertex, weight))
+
+            for i in range(offsets[current_vertex], offsets[current_vertex + 1]):
+                neighbor = targets[i]
+                if not visited[neighbor]:
+                    heapq.heappush(min_heap, (weights[i], neighbor, current_vertex))
+
+    return mst_edges
+
 # Example usage:
 # graph = {
 #     'A': [('B', 1), ('C', 3)],
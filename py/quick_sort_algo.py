@@ -40,6 +40,7 @@ The core idea of Quick Sort is to select a 'pivot' element from the array and pa
 """
 - Three-Way Quick Sort: Handles duplicates efficiently by partitioning the array into three parts: less than, equal to, and greater than the pivot.
 - Randomized Quick Sort: Randomly selects the pivot to minimize the chances of encountering the worst-case scenario.
+- Introsort: In-place Quick Sort with median-of-three pivots and Hoare partitioning that switches to insertion sort for small partitions and to Heap Sort when recursion gets too deep, guaranteeing O(n log n) time and O(log n) stack.
 """
 
 ## 7. Trade-offs
@@ -61,6 +62,12 @@ The core idea of Quick Sort is to select a 'pivot' element from the array and pa
 """
 
 ## 10. Code Implementation (Demo)
+from key_sort_algo import load_module
+
+# The heap sort fallback of introsort() is the one in heap_sort_algo.py
+heap_sort_iterative = load_module("heap_sort_algo.py").heap_sort_iterative
+
+
 def quick_sort(arr):
     """Sorts an array using the Quick Sort algorithm."""
     if len(arr) <= 1:
@@ -71,3 +78,108 @@ def quick_sort(arr):
         middle = [x for x in arr if x == pivot]
         right = [x for x in arr if x > pivot]
         return quick_sort(left) + middle + quick_sort(right)
+
+
+def _insertion_sort_range(arr, lo, hi):
+    """Sorts arr[lo:hi + 1] in place; used for small partitions."""
+    for i in range(lo + 1, hi + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and key < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def _median_of_three(arr, a, b, c):
+    """Returns the index of the median of arr[a], arr[b], arr[c]."""
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+
+def _choose_pivot(arr, lo, hi):
+    """Median-of-three for mid-sized partitions, Tukey's ninther for large ones."""
+    mid = (lo + hi) // 2
+    if hi - lo < 128:
+        return arr[_median_of_three(arr, lo, mid, hi)]
+    step = (hi - lo) // 8
+    m1 = _median_of_three(arr, lo, lo + step, lo + 2 * step)
+    m2 = _median_of_three(arr, mid - step, mid, mid + step)
+    m3 = _median_of_three(arr, hi - 2 * step, hi - step, hi)
+    return arr[_median_of_three(arr, m1, m2, m3)]
+
+
+def _hoare_partition(arr, lo, hi, pivot):
+    """Hoare partition around a pivot value; returns j with arr[lo..j] <= pivot <= arr[j+1..hi]."""
+    i = lo - 1
+    j = hi + 1
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < arr[j]:
+            j -= 1
+        if i >= j:
+            return j
+        arr[i], arr[j] = arr[j], arr[i]
+
+
+def introsort(arr, insertion_threshold=16):
+    """
+    Sorts arr in place using introsort (introspective sort).
+
+    Quick Sort with median-of-three / ninther pivots and Hoare partitioning,
+    insertion sort for partitions of at most `insertion_threshold` elements,
+    and a heap sort fallback once the depth exceeds 2 * log2(n). Always
+    recurses into the smaller partition and loops on the larger one, so the
+    stack stays O(log n) and the worst case is O(n log n).
+    """
+    def _sort(lo, hi, depth_limit):
+        while hi - lo + 1 > insertion_threshold:
+            if depth_limit == 0:
+                heap_sort_iterative(arr, lo, hi + 1)
+                return
+            depth_limit -= 1
+            p = _hoare_partition(arr, lo, hi, _choose_pivot(arr, lo, hi))
+            if p - lo < hi - p:
+                _sort(lo, p, depth_limit)
+                lo = p + 1
+            else:
+                _sort(p + 1, hi, depth_limit)
+                hi = p
+        _insertion_sort_range(arr, lo, hi)
+
+    n = len(arr)
+    if n > 1:
+        _sort(0, n - 1, 2 * n.bit_length())
+    return arr
+
+
+def benchmark_quick_sort(sizes=(10_000, 100_000), repeat=3):
+    """Times quick_sort (copying) against introsort (in-place) on random and sorted inputs."""
+    import random
+    import timeit
+
+    for n in sizes:
+        data = {
+            "random": [random.random() for _ in range(n)],
+            "sorted": list(range(n)),
+            "few-unique": [random.randrange(4) for _ in range(n)],
+        }
+        for name, values in data.items():
+            t_quick = min(timeit.repeat(lambda: quick_sort(values), number=1, repeat=repeat))
+            t_intro = min(timeit.repeat(lambda: introsort(list(values)), number=1, repeat=repeat))
+            print(f"n={n:>9} {name:<10} quick_sort={t_quick:.4f}s introsort={t_intro:.4f}s")
+
+
+# Example usage
+# data = [38, 27, 43, 3, 9, 82, 10]
+# introsort(data)
+# print(data)  # Output: [3, 9, 10, 27, 38, 43, 82]
+# benchmark_quick_sort()
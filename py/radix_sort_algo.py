@@ -43,6 +43,7 @@ The intuition is that by sorting numbers based on individual digit significance,
 """
 - LSD Radix Sort: Processes digits from least significant to most significant.
 - MSD Radix Sort: Processes digits from most significant to least significant. Often implemented using recursive approaches.
+- Byte-wise (base-256) Radix Sort: Uses one byte per digit, so 32-bit keys need 4 passes; order-preserving key transforms extend it to signed integers, floats and fixed-length byte strings.
 """
 
 ## 7. Trade-offs
@@ -96,6 +97,219 @@ def radix_sort(arr):
         exp *= 10
 
 # Example usage
-arr = [170, 45, 75, 90, 802, 24, 2, 66]
-radix_sort(arr)
-print("Sorted array:", arr)
+# arr = [170, 45, 75, 90, 802, 24, 2, 66]
+# radix_sort(arr)
+# print("Sorted array:", arr)
+
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from key_sort_algo import load_module
+
+# typed_view() is shared with the other buffer sorts in heap_sort_algo.py
+typed_view = load_module("heap_sort_algo.py").typed_view
+
+_ARRAY_KINDS = {
+    "b": "int", "h": "int", "i": "int", "l": "int", "q": "int",
+    "B": "uint", "H": "uint", "I": "uint", "L": "uint", "Q": "uint",
+    "f": "float", "d": "float",
+}
+
+
+def _radix_keys(values, kind, width):
+    """Maps values to unsigned integers whose natural order matches the values' order."""
+    import operator
+    import struct
+
+    bits = 8 * width
+    if kind in ("int", "uint"):
+        try:
+            keys = [operator.index(v) for v in values]
+        except TypeError:
+            bad = next(v for v in values if not hasattr(v, "__index__"))
+            raise TypeError(f"{kind} keys must be integers, got {type(bad).__name__}") from None
+    if kind == "uint":
+        if keys and (min(keys) < 0 or max(keys) >> bits):
+            raise ValueError(f"values do not fit in {width} unsigned bytes")
+        return keys
+    if kind == "int":
+        # Flipping the sign bit maps [-2^(b-1), 2^(b-1)) onto [0, 2^b) in order
+        bias = 1 << (bits - 1)
+        keys = [k + bias for k in keys]
+        if keys and (min(keys) < 0 or max(keys) >> bits):
+            raise ValueError(f"values do not fit in {width} signed bytes")
+        return keys
+    if kind == "float":
+        # IEEE 754: set the sign bit of positives, invert every bit of negatives
+        fmt, sign, mask = (">d", 1 << 63, (1 << 64) - 1) if width == 8 else (">f", 1 << 31, (1 << 32) - 1)
+        keys = []
+        for v in values:
+            packed = struct.pack(fmt, v)
+            # Ints next to floats must survive the conversion, or they sort out of order
+            if isinstance(v, int) and struct.unpack(fmt, packed)[0] != v:
+                raise ValueError(f"{v} cannot be stored exactly as float{8 * width}")
+            u = int.from_bytes(packed, "big")
+            keys.append(u ^ mask if u & sign else u | sign)
+        return keys
+    if kind == "bytes":
+        if any(len(v) != width for v in values):
+            raise ValueError(f"byte keys must all be {width} bytes long")
+        return [int.from_bytes(v, "big") for v in values]
+    raise ValueError(f"unknown key kind: {kind!r}")
+
+
+def _radix_passes(keys, values, width):
+    """LSD base-256 counting passes over parallel key/value lists; skips constant digits."""
+    n = len(keys)
+    for shift in range(0, 8 * width, 8):
+        count = [0] * 256
+        for k in keys:
+            count[(k >> shift) & 0xFF] += 1
+        if n in count:
+            continue  # every key has the same byte here
+
+        # Exclusive prefix sum gives each digit's first output slot
+        total = 0
+        for d in range(256):
+            count[d], total = total, total + count[d]
+
+        out_keys = [0] * n
+        out_values = [None] * n
+        for k, v in zip(keys, values):
+            d = (k >> shift) & 0xFF
+            pos = count[d]
+            out_keys[pos] = k
+            out_values[pos] = v
+            count[d] = pos + 1
+        keys, values = out_keys, out_values
+    return values
+
+
+def _radix_sort_numpy(arr):
+    """Vectorized byte-wise LSD radix sort of a 1-D NumPy array, in place."""
+    kind = arr.dtype.kind
+    width = arr.dtype.itemsize
+    bits = 8 * width
+    utype = np.dtype(f"u{width}") if kind != "S" else None
+
+    if kind == "u":
+        keys = arr.astype(utype)
+    elif kind == "i":
+        keys = arr.view(utype) ^ utype.type(1 << (bits - 1))
+    elif kind == "f":
+        u = arr.view(utype)
+        sign = utype.type(1 << (bits - 1))
+        keys = np.where(u & sign, ~u, u | sign)
+    else:
+        raise TypeError(f"unsupported dtype for radix sort: {arr.dtype}")
+
+    order = np.arange(len(arr))
+    for shift in range(0, bits, 8):
+        digits = ((keys >> utype.type(shift)) & utype.type(0xFF)).astype(np.uint8)
+        if np.bincount(digits, minlength=256).max() == len(arr):
+            continue
+        # A stable sort of uint8 digits is NumPy's own counting/radix scatter
+        by_digit = np.argsort(digits, kind="stable")
+        keys = keys[by_digit]
+        order = order[by_digit]
+    arr[:] = arr[order]
+    return arr
+
+
+def radix_sort_bytes(arr, kind=None, width=None):
+    """
+    Sorts arr in place with a base-256 LSD radix sort.
+
+    `kind` is "int" (signed), "uint", "float" or "bytes" (fixed-length byte
+    strings) and `width` the key size in bytes. Both are inferred from the
+    typecode of an array.array or the dtype of a NumPy array. Lists of
+    numbers containing a float are sorted as 8-byte floats, lists of bytes
+    as "bytes", other lists as signed 8-byte integers. Non-integer values
+    with kind "int" or "uint" raise TypeError, and ints that a "float" key
+    cannot hold exactly (e.g. above 2**53) raise ValueError. A 4-byte key
+    takes at most 4 passes and passes whose byte is identical for every key
+    are skipped.
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        return _radix_sort_numpy(arr)
+
+    typecode = getattr(arr, "typecode", None)
+    if typecode is not None:
+        kind = kind or _ARRAY_KINDS[typecode]
+        width = width or arr.itemsize
+    if kind is None:
+        if any(isinstance(v, float) for v in arr):
+            kind = "float"
+        elif len(arr) and isinstance(arr[0], (bytes, bytearray)):
+            kind = "bytes"
+        else:
+            kind = "int"
+    if width is None:
+        width = len(arr[0]) if kind == "bytes" and len(arr) else 8
+
+    values = list(arr)
+    keys = _radix_keys(values, kind, width)
+    arr[:] = type(arr)(typecode, _radix_passes(keys, values, width)) if typecode else _radix_passes(keys, values, width)
+    return arr
+
+
+
+def radix_sort_buffer(buffer, typecode=None):
+    """
+    Byte-wise LSD radix sorts an array.array, memoryview, mmap or NumPy array in place.
+
+    The items are reinterpreted as unsigned integers of the same width and
+    the raw bit patterns are scattered between the buffer and one packed
+    auxiliary array, so no list of Python objects is built. Signed and
+    float items are ordered through the same key transforms as
+    radix_sort_bytes.
+    """
+    from array import array
+
+    with typed_view(buffer, typecode) as view:
+        kind = _ARRAY_KINDS[view.format]
+        width = view.itemsize
+        unsigned = {1: "B", 2: "H", 4: "I", 8: "Q"}[width]
+        bits = 8 * width
+        sign = 1 << (bits - 1)
+        mask = (1 << bits) - 1
+
+        if kind == "uint":
+            to_key = int
+        elif kind == "int":
+            to_key = lambda u: u ^ sign
+        else:
+            to_key = lambda u: u ^ mask if u & sign else u | sign
+
+        with view.cast("B").cast(unsigned) as raw:
+            n = len(raw)
+            src, dst = raw, array(unsigned, bytes(n * width))
+            for shift in range(0, bits, 8):
+                count = [0] * 256
+                for u in src:
+                    count[(to_key(u) >> shift) & 0xFF] += 1
+                if n in count:
+                    continue
+
+                total = 0
+                for d in range(256):
+                    count[d], total = total, total + count[d]
+                for u in src:
+                    d = (to_key(u) >> shift) & 0xFF
+                    dst[count[d]] = u
+                    count[d] += 1
+                src, dst = dst, src
+            if src is not raw:
+                raw[:] = src
+    return buffer
+
+
+# Example usage
+# from array import array
+# print(radix_sort_bytes([170, -45, 75, -90, 802, 24, 2, 66]))  # Output: [-90, -45, 2, 24, 66, 75, 170, 802]
+# print(radix_sort_bytes(array("d", [3.5, -0.0, -2.25, 1e-9])))  # Output: array('d', [-2.25, -0.0, 1e-09, 3.5])
+# print(radix_sort_bytes([b"cab", b"abc", b"bca"], kind="bytes"))  # Output: [b'abc', b'bca', b'cab']
+# print(radix_sort_buffer(array("i", [5, -1, 3])))  # Output: array('i', [-1, 3, 5])
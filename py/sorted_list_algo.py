@@ -0,0 +1,299 @@
+# Sorted List (Chunked List with Positional Index) Algorithm
+
+## 1. Category / Type
+"""
+Data Structure: ordered container built from Binary Search over a list of sorted chunks, with a Fenwick tree (Binary Indexed Tree) as positional index.
+"""
+
+## 2. Core Idea / Intuition
+"""
+A flat sorted Python list gives O(log n) binary search but O(n) inserts and deletes, because every element after the insertion point has to move. At 10M elements that memmove dominates.
+
+Splitting the values into sorted chunks of about `load` elements (e.g. 1000) keeps each memmove small. A second, much shorter list stores the maximum of each chunk, so finding the right chunk is one binary search and finding the slot inside it is another.
+
+For positional queries (rank, k-th element) a Fenwick tree over the chunk lengths answers "how many elements come before chunk i" and "which chunk holds the k-th element" in O(log(number of chunks)).
+"""
+
+## 3. Steps / Flow
+"""
+1. add(x): binary search the chunk maxima, insort x into that chunk, update the Fenwick tree. If the chunk grows past 2 * load, split it in half and rebuild the index.
+2. remove(x): locate x the same way and delete it. Empty chunks are dropped; a chunk shrinking below load / 2 is merged with its neighbour.
+3. bisect_left(x) / rank(x): elements in earlier chunks (Fenwick prefix sum) + position inside the chunk.
+4. self[k]: descend the Fenwick tree to the chunk containing position k, then index inside the chunk.
+5. irange(lo, hi): find the two boundary positions, then walk the chunks between them.
+"""
+
+## 4. Time & Space Complexity
+"""
+| Operation              | Time                        | Space |
+|------------------------|-----------------------------|-------|
+| add / remove           | O(log n) + O(load) memmove  | O(1) amortized |
+| bisect / rank / count  | O(log n)                    | O(1)  |
+| k-th element           | O(log n)                    | O(1)  |
+| range iteration        | O(log n + k)                | O(1)  |
+| Total                  |                             | O(n)  |
+
+- Chunk splits and merges rebuild the index in O(n / load), amortized over at least load / 2 updates.
+"""
+
+## 5. Use Cases
+"""
+- Leaderboards with constant score updates and rank queries.
+- Order books, sliding-window medians and percentiles.
+- Any time a list must stay sorted under interleaved inserts, deletes and lookups.
+"""
+
+## 6. Common Variants
+"""
+- Balanced BSTs (red-black, AVL) and skip lists: O(log n) updates but many small objects and pointer chasing.
+- B-trees: the same chunking idea, applied recursively.
+- sortedcontainers.SortedList: the well-known Python library using this design.
+"""
+
+## 7. Trade-offs
+"""
+- Much lower memory and better locality than node-based trees in Python.
+- Updates still move up to 2 * load items, so load is a tuning knob (larger chunks: faster lookups, slower updates).
+- Values must be totally ordered and must not be mutated while stored.
+"""
+
+## 8. Pitfalls / Gotchas
+"""
+- Keep the chunk maxima in sync after every add and remove, or lookups go to the wrong chunk.
+- Negative indices must be translated before descending the Fenwick tree.
+- Duplicates are allowed; remove() deletes one occurrence.
+"""
+
+## 9. Classic Problems
+"""
+- Count of Smaller Numbers After Self.
+- Sliding Window Median.
+- Online rank queries (leaderboards).
+"""
+
+## 10. Code Implementation (Demo)
+# bisect_left / bisect_right are the C implementations of lower_bound() /
+# upper_bound() in binary_search_algo.py (same results), about 3-4x faster
+# on the chunk lookups every operation performs
+from bisect import bisect_left, bisect_right, insort
+
+
+class SortedList:
+    def __init__(self, iterable=(), load=1000):
+        self._load = load
+        values = sorted(iterable)
+        self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [chunk[-1] for chunk in self._lists]
+        self._len = len(values)
+        self._build_index()
+
+    # --- positional index (Fenwick tree over chunk lengths) ---
+
+    def _build_index(self):
+        m = len(self._lists)
+        tree = [0] + [len(chunk) for chunk in self._lists]
+        for i in range(1, m + 1):
+            j = i + (i & -i)
+            if j <= m:
+                tree[j] += tree[i]
+        self._tree = tree
+
+    def _index_add(self, pos, delta):
+        tree = self._tree
+        i = pos + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, pos):
+        """Number of elements in the chunks before chunk pos."""
+        total = 0
+        i = pos
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, idx):
+        """Returns (chunk, offset) of the element at position idx."""
+        tree = self._tree
+        m = len(tree) - 1
+        pos = 0
+        step = 1 << (m.bit_length() - 1) if m else 0
+        while step:
+            nxt = pos + step
+            if nxt <= m and tree[nxt] <= idx:
+                pos = nxt
+                idx -= tree[nxt]
+            step >>= 1
+        return pos, idx
+
+    # --- updates ---
+
+    def add(self, value):
+        lists, maxes = self._lists, self._maxes
+        self._len += 1
+        if not lists:
+            lists.append([value])
+            maxes.append(value)
+            self._build_index()
+            return
+
+        pos = bisect_right(maxes, value)
+        if pos == len(maxes):
+            pos -= 1
+            lists[pos].append(value)
+            maxes[pos] = value
+        else:
+            insort(lists[pos], value)
+
+        chunk = lists[pos]
+        if len(chunk) > 2 * self._load:
+            half = chunk[self._load:]
+            del chunk[self._load:]
+            maxes[pos] = chunk[-1]
+            lists.insert(pos + 1, half)
+            maxes.insert(pos + 1, half[-1])
+            self._build_index()
+        else:
+            self._index_add(pos, 1)
+
+    def _delete(self, pos, idx):
+        lists, maxes = self._lists, self._maxes
+        chunk = lists[pos]
+        del chunk[idx]
+        self._len -= 1
+
+        if not chunk:
+            del lists[pos]
+            del maxes[pos]
+            self._build_index()
+        elif len(chunk) < self._load // 2 and len(lists) > 1:
+            # Merge with a neighbour, re-splitting if the result is too big
+            if pos == len(lists) - 1:
+                pos -= 1
+            merged = lists[pos] + lists[pos + 1]
+            del lists[pos + 1]
+            del maxes[pos + 1]
+            if len(merged) > 2 * self._load:
+                lists[pos] = merged[:self._load]
+                lists.insert(pos + 1, merged[self._load:])
+                maxes[pos] = lists[pos][-1]
+                maxes.insert(pos + 1, merged[-1])
+            else:
+                lists[pos] = merged
+                maxes[pos] = merged[-1]
+            self._build_index()
+        else:
+            maxes[pos] = chunk[-1]
+            self._index_add(pos, -1)
+
+    def remove(self, value):
+        """Removes one occurrence of value; raises ValueError if it is missing."""
+        pos = bisect_left(self._maxes, value)
+        if pos < len(self._maxes):
+            idx = bisect_left(self._lists[pos], value)
+            if self._lists[pos][idx] == value:
+                self._delete(pos, idx)
+                return
+        raise ValueError(f"{value!r} not in SortedList")
+
+    def discard(self, value):
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+
+    def pop(self, index=-1):
+        pos, idx = self._locate(self._normalize(index))
+        value = self._lists[pos][idx]
+        self._delete(pos, idx)
+        return value
+
+    # --- queries ---
+
+    def bisect_left(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._prefix(pos) + bisect_left(self._lists[pos], value)
+
+    def bisect_right(self, value):
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._prefix(pos) + bisect_right(self._lists[pos], value)
+
+    def rank(self, value):
+        """Number of stored elements strictly smaller than value."""
+        return self.bisect_left(value)
+
+    def count(self, value):
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def index(self, value):
+        idx = self.bisect_left(value)
+        if idx == self._len or self[idx] != value:
+            raise ValueError(f"{value!r} not in SortedList")
+        return idx
+
+    def _normalize(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        return index
+
+    def __getitem__(self, index):
+        """Returns the element of the given rank (k-th smallest, 0-based)."""
+        pos, idx = self._locate(self._normalize(index))
+        return self._lists[pos][idx]
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """Iterates over the values between minimum and maximum in sorted order."""
+        if minimum is None:
+            start = 0
+        else:
+            start = self.bisect_left(minimum) if inclusive[0] else self.bisect_right(minimum)
+        if maximum is None:
+            stop = self._len
+        else:
+            stop = self.bisect_right(maximum) if inclusive[1] else self.bisect_left(maximum)
+        if start >= stop:
+            return
+        remaining = stop - start
+        pos, idx = self._locate(start)
+        while remaining:
+            chunk = self._lists[pos]
+            end = min(len(chunk), idx + remaining)
+            for i in range(idx, end):
+                yield chunk[i]
+            remaining -= end - idx
+            pos += 1
+            idx = 0
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        chunk = self._lists[pos]
+        return chunk[bisect_left(chunk, value)] == value
+
+    def __iter__(self):
+        for chunk in self._lists:
+            yield from chunk
+
+    def __repr__(self):
+        return f"SortedList({list(self)!r})"
+
+
+# Example usage
+# board = SortedList([50, 20, 90])
+# board.add(70)
+# board.remove(20)
+# print(board)  # Output: SortedList([50, 70, 90])
+# print(board.rank(70), board[0], board[-1])  # Output: 1 50 90
+# print(list(board.irange(60, 100)))  # Output: [70, 90]
@@ -0,0 +1,270 @@
+# Sorting Benchmark Algorithm
+
+## 1. Category / Type
+"""
+Performance measurement / empirical algorithm analysis.
+"""
+
+## 2. Core Idea / Intuition
+"""
+Big-O tables say how an algorithm scales, not how fast it is on your data. A benchmark harness runs every sort on the same inputs, across sizes and data shapes, and records what it costs: wall time, number of comparisons and peak memory.
+
+Saving the results lets later runs be compared against a baseline, so a change that makes a sort slower is flagged instead of noticed months later.
+"""
+
+## 3. Steps / Flow
+"""
+1. Generate inputs for each (distribution, size) pair from a fixed seed.
+2. For each sort, time it on a fresh copy of the input (best of several repeats).
+3. Count comparisons in a separate run by wrapping values in an object that counts calls to its comparison operators.
+4. Measure peak memory in another run with tracemalloc.
+5. Save all rows to JSON.
+6. Compare against a saved baseline and flag rows whose time grew by more than a tolerance.
+"""
+
+## 4. Time & Space Complexity
+"""
+| Best | Average | Worst | Space |
+|------|---------|-------|-------|
+| sum of the sorts' costs x repeats | same | same | O(n) per input |
+
+- Quadratic sorts are skipped above `max_quadratic_n` to keep runs finite.
+"""
+
+## 5. Use Cases
+"""
+- Choosing a sort for a given data shape (nearly sorted, many duplicates, skewed).
+- Catching performance regressions in CI.
+- Demonstrating the gap between O(n^2) and O(n log n) algorithms.
+"""
+
+## 6. Common Variants
+"""
+- Micro-benchmarks with timeit for a single function.
+- Statistical benchmarking (pyperf) with warm-up and outlier rejection.
+- Operation counting instead of timing, for machine-independent results.
+"""
+
+## 7. Trade-offs
+"""
+- Wall time is realistic but noisy; comparison counts are stable but ignore memory traffic.
+- tracemalloc and comparison counting slow the sort down, so they run separately from timing.
+"""
+
+## 8. Pitfalls / Gotchas
+"""
+- Always sort a fresh copy: in-place sorts leave the input sorted for the next repeat.
+- Use the minimum of several repeats; the mean is dominated by noise.
+- Integer-only sorts (counting, radix) cannot take wrapped values, so their comparison count is not recorded.
+- A regression threshold tighter than the machine's noise floor produces false alarms.
+"""
+
+## 9. Classic Problems
+"""
+- Sorting algorithm comparison charts.
+- Performance regression tracking.
+"""
+
+## 10. Code Implementation (Demo)
+import json
+import random
+import time
+import tracemalloc
+
+from key_sort_algo import load_module
+
+# sort name -> (module file in this folder, function name, quadratic?, integer-only?)
+BENCHMARK_SORTS = {
+    "bubble_sort": ("bubble_sort_algo.py", "bubble_sort", True, False),
+    "selection_sort": ("selection_sort_algo.py", "selection_sort", True, False),
+    "insertion_sort": ("insertion_sort_algo.py", "insertion_sort", True, False),
+    "merge_sort": ("merge_sort_algo.py", "merge_sort", False, False),
+    "quick_sort": ("quick_sort_algo.py", "quick_sort", False, False),
+    "introsort": ("quick_sort_algo.py", "introsort", False, False),
+    "heap_sort": ("heap_sort_algo.py", "heap_sort", False, False),
+    "natural_merge_sort": ("timsort_algo.py", "natural_merge_sort", False, False),
+    "counting_sort": ("counting_sort_algo.py", "counting_sort", False, True),
+    "radix_sort": ("radix_sort_algo.py", "radix_sort", False, True),
+    "bucket_sort": ("bucket_sort_algo.py", "bucket_sort", False, True),
+}
+
+SIZES = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+def _zipfian(n, rng, s=1.2):
+    ranks = min(n, 10_000)
+    weights = [1 / (k ** s) for k in range(1, ranks + 1)]
+    return rng.choices(range(ranks), weights=weights, k=n)
+
+
+def _mostly_sorted(n, rng):
+    data = list(range(n))
+    for _ in range(max(1, n // 100)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+DISTRIBUTIONS = {
+    "random": lambda n, rng: [rng.randrange(n) for _ in range(n)],
+    "sorted": lambda n, rng: list(range(n)),
+    "reversed": lambda n, rng: list(range(n, 0, -1)),
+    "few_unique": lambda n, rng: [rng.randrange(8) for _ in range(n)],
+    "zipfian": _zipfian,
+    "organ_pipe": lambda n, rng: list(range(n // 2)) + list(range(n - n // 2, 0, -1)),
+    "mostly_sorted": _mostly_sorted,
+}
+
+
+class CountedValue:
+    """Wraps a value and counts every comparison made on it."""
+
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        CountedValue.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        CountedValue.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        CountedValue.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        CountedValue.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        CountedValue.comparisons += 1
+        return self.value == other.value
+
+    __hash__ = None
+
+
+def load_sort(name):
+    """Returns the sort function registered under name, loading its file on first use."""
+    filename, func_name, _, _ = BENCHMARK_SORTS[name]
+    return getattr(load_module(filename), func_name)
+
+
+def benchmark_one(func, data, repeat=3, count_comparisons=True, measure_memory=True):
+    """Returns (best wall time in seconds, comparisons or None, peak traced bytes or None)."""
+    best = float("inf")
+    for _ in range(repeat):
+        copy = list(data)
+        start = time.perf_counter()
+        func(copy)
+        best = min(best, time.perf_counter() - start)
+
+    comparisons = None
+    if count_comparisons:
+        wrapped = [CountedValue(v) for v in data]
+        CountedValue.comparisons = 0
+        func(wrapped)
+        comparisons = CountedValue.comparisons
+
+    peak = None
+    if measure_memory:
+        copy = list(data)
+        tracemalloc.start()
+        func(copy)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return best, comparisons, peak
+
+
+def run_benchmarks(sorts=None, sizes=SIZES, distributions=None, repeat=3,
+                   max_quadratic_n=10_000, max_traced_n=1_000_000, seed=0):
+    """
+    Runs every selected sort on every (distribution, size) input.
+
+    Returns a list of result rows: dicts with sort, distribution, n,
+    seconds, comparisons and peak_bytes. A sort that hits the recursion
+    limit gets an "error" entry and None for the measurements. Quadratic
+    sorts are skipped above max_quadratic_n; comparison counting and
+    tracemalloc are skipped above max_traced_n because they slow the sort
+    down several times.
+    """
+    sorts = sorts or list(BENCHMARK_SORTS)
+    distributions = distributions or list(DISTRIBUTIONS)
+    results = []
+    for dist in distributions:
+        for n in sizes:
+            data = DISTRIBUTIONS[dist](n, random.Random(seed))
+            for name in sorts:
+                _, _, quadratic, integer_only = BENCHMARK_SORTS[name]
+                if quadratic and n > max_quadratic_n:
+                    continue
+                traced = n <= max_traced_n
+                row = {"sort": name, "distribution": dist, "n": n}
+                try:
+                    seconds, comparisons, peak = benchmark_one(
+                        load_sort(name), data, repeat,
+                        count_comparisons=traced and not integer_only,
+                        measure_memory=traced,
+                    )
+                    row.update(seconds=seconds, comparisons=comparisons, peak_bytes=peak)
+                except RecursionError:
+                    # e.g. quick_sort's middle pivot degrades to O(n) depth on organ-pipe input
+                    row.update(seconds=None, comparisons=None, peak_bytes=None, error="RecursionError")
+                results.append(row)
+    return results
+
+
+def save_results(results, path):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def find_regressions(results, baseline, tolerance=0.10, min_seconds=0.001):
+    """
+    Returns the rows of results that got slower than the matching baseline row.
+
+    A row regresses when its time exceeds the baseline time by more than
+    `tolerance` (a fraction); rows faster than min_seconds in the baseline are
+    ignored as noise, and a row that now fails counts as a regression with
+    slowdown None. Each returned row gains "baseline_seconds" and "slowdown".
+    """
+    previous = {(r["sort"], r["distribution"], r["n"]): r for r in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get((row["sort"], row["distribution"], row["n"]))
+        if old is None or old["seconds"] is None or old["seconds"] < min_seconds:
+            continue
+        if row["seconds"] is None:
+            regressions.append(dict(row, baseline_seconds=old["seconds"], slowdown=None))
+            continue
+        slowdown = row["seconds"] / old["seconds"]
+        if slowdown > 1 + tolerance:
+            regressions.append(dict(row, baseline_seconds=old["seconds"], slowdown=slowdown))
+    return regressions
+
+
+def print_results(results):
+    for r in results:
+        if r["seconds"] is None:
+            print(f"{r['sort']:<20} {r['distribution']:<14} n={r['n']:<9} {r['error']}")
+            continue
+        comparisons = "-" if r["comparisons"] is None else r["comparisons"]
+        peak = "-" if r["peak_bytes"] is None else r["peak_bytes"]
+        print(f"{r['sort']:<20} {r['distribution']:<14} n={r['n']:<9} "
+              f"{r['seconds']:.4f}s comparisons={comparisons} peak_bytes={peak}")
+
+
+# Example usage
+# results = run_benchmarks(sizes=(100, 1_000, 10_000))
+# print_results(results)
+# save_results(results, "sort_baseline.json")
+# later: print(find_regressions(run_benchmarks(sizes=(100, 1_000, 10_000)), load_results("sort_baseline.json")))
@@ -0,0 +1,175 @@
+# Sorting Network (Batched) Algorithm
+
+## 1. Category / Type
+"""
+Data-oblivious comparison sort / parallel sorting (Batcher's odd-even merge sort network).
+"""
+
+## 2. Core Idea / Intuition
+"""
+A sorting network is a fixed sequence of compare-exchange operations (i, j): put min(x[i], x[j]) in i and max in j. The sequence depends only on the length n, never on the data, so the same network sorts every array of that length.
+
+Because the operations are fixed, many small arrays can be sorted at once: stack them as the rows of a matrix and apply each compare-exchange to whole columns. Comparators that touch disjoint positions form a layer and run as a single vectorized min/max over the batch. A Python loop over a million rows becomes a few dozen NumPy operations.
+"""
+
+## 3. Steps / Flow
+"""
+1. Build Batcher's odd-even merge sort network for n inputs, grouped into layers of independent comparators (comparators past n are dropped, which is the same as padding with +infinity).
+2. For each layer with index lists I and J:
+   - lo = minimum(X[:, I], X[:, J]); hi = maximum(X[:, I], X[:, J])
+   - X[:, I] = lo; X[:, J] = hi
+3. For ragged groups, pad every group to the longest length with the largest value (or +infinity), sort the rows, and cut each row back to its length.
+"""
+
+## 4. Time & Space Complexity
+"""
+| Best | Average | Worst | Space |
+|------|---------|-------|-------|
+| O(n log^2 n) comparators | O(n log^2 n) | O(n log^2 n) | O(rows x n) |
+
+- Network depth is O(log^2 n) layers: 10 layers for n = 16, 15 for n = 32.
+- Work per layer is one vectorized pass over the batch.
+"""
+
+## 5. Use Cases
+"""
+- Sorting millions of short rows (feature vectors, per-key groups, k-NN candidate lists).
+- SIMD and GPU sorting, where branch-free fixed comparisons matter.
+- Constant-time (side-channel free) sorting in cryptography.
+"""
+
+## 6. Common Variants
+"""
+- Bitonic sorter: the other classic Batcher network, slightly more comparators.
+- Optimal small networks (e.g. 19 comparators for n = 8, 60 for n = 16).
+- AKS network: O(n log n) comparators, but impractical constants.
+"""
+
+## 7. Trade-offs
+"""
+- Pros: no data-dependent branches, trivially parallel across rows.
+- Cons: O(n log^2 n) comparisons, so only worth it for small n; not stable.
+"""
+
+## 8. Pitfalls / Gotchas
+"""
+- NaN breaks min/max networks: NumPy's minimum/maximum propagate NaN into both slots. Compare-exchange with a swap mask instead, treating NaN as +infinity.
+- The pad value must not sort before any real value (use the batch maximum, +inf or the dtype's maximum).
+- Networks are not stable; use them on plain values, not records.
+"""
+
+## 9. Classic Problems
+"""
+- Sorting each row of a matrix.
+- Median filters (sorting small windows).
+- The 0-1 principle: a network sorts all inputs iff it sorts all 0/1 inputs.
+"""
+
+## 10. Code Implementation (Demo)
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@lru_cache(maxsize=None)
+def batcher_layers(n):
+    """Returns Batcher's odd-even merge sort network for n inputs as a tuple of layers of (i, j) pairs."""
+    layers = []
+    p = 1
+    while p < n:
+        k = p
+        while k >= 1:
+            layer = []
+            for j in range(k % p, n - k, 2 * k):
+                for i in range(min(k, n - j - k)):
+                    if (i + j) // (2 * p) == (i + j + k) // (2 * p):
+                        layer.append((i + j, i + j + k))
+            if layer:
+                layers.append(tuple(layer))
+            k //= 2
+        p *= 2
+    return tuple(layers)
+
+
+@lru_cache(maxsize=None)
+def _layer_indices(n):
+    """The network's layers as pairs of NumPy index arrays."""
+    return [(np.array([a for a, _ in layer], dtype=np.intp), np.array([b for _, b in layer], dtype=np.intp))
+            for layer in batcher_layers(n)]
+
+
+def sort_row(row):
+    """Sorts one list in place by applying the network (pure Python reference); NaNs go last."""
+    for layer in batcher_layers(len(row)):
+        for i, j in layer:
+            a, b = row[i], row[j]
+            # a != a is only true for NaN, which is treated as +infinity
+            if b < a or (a != a and b == b):
+                row[i], row[j] = b, a
+    return row
+
+
+def sort_rows(matrix, inplace=False):
+    """
+    Sorts every row of a 2-D NumPy array with vectorized compare-exchange layers.
+
+    Each layer of the network is one gather, one swap mask and one scatter
+    over all rows at once. The mask-based compare-exchange keeps every value
+    (np.minimum/np.maximum would copy a NaN into both slots) and treats NaN
+    as +infinity, so NaNs end up last as with np.sort. Without NumPy, a list
+    of lists is sorted row by row with sort_row().
+    """
+    if np is None:
+        rows = matrix if inplace else [list(row) for row in matrix]
+        for row in rows:
+            sort_row(row)
+        return rows
+
+    x = matrix if inplace else np.array(matrix, copy=True)
+    nan_aware = x.dtype.kind in "fc"
+    for i, j in _layer_indices(x.shape[1]):
+        a = x[:, i]
+        b = x[:, j]
+        swap = b < a
+        if nan_aware:
+            swap |= np.isnan(a) & ~np.isnan(b)
+        x[:, i] = np.where(swap, b, a)
+        x[:, j] = np.where(swap, a, b)
+    return x
+
+
+def sort_ragged(groups, pad=None):
+    """
+    Sorts many short groups of different lengths in one batch.
+
+    Groups are padded to the longest length with `pad`, which must not sort
+    before any value; by default the largest value overall (NaN if any value
+    is NaN, since NaN sorts last), so the dtype is kept and padding lands at
+    the end of each row. The rows are sorted with
+    sort_rows() and trimmed back. Returns a list of sorted lists.
+    """
+    if not groups:
+        return []
+    lengths = [len(g) for g in groups]
+    width = max(lengths)
+    if pad is None and width:
+        values = [v for g in groups for v in g]
+        pad = float("nan") if any(v != v for v in values) else max(values)
+    padded = [list(g) + [pad] * (width - len(g)) for g in groups]
+    if np is not None:
+        padded = np.array(padded)
+    rows = sort_rows(padded, inplace=True)
+    if np is not None:
+        return [row[:length].tolist() for row, length in zip(rows, lengths)]
+    return [row[:length] for row, length in zip(rows, lengths)]
+
+
+# Example usage
+# print(sort_row([5, 1, 4, 2, 3]))  # Output: [1, 2, 3, 4, 5]
+# import numpy as np
+# batch = np.random.rand(1_000_000, 16)
+# print(np.array_equal(sort_rows(batch), np.sort(batch, axis=1)))  # Output: True
+# print(sort_ragged([[3, 1], [9, 7, 8], [5]]))  # Output: [[1, 3], [7, 8, 9], [5]]
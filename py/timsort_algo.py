@@ -0,0 +1,234 @@
+# TimSort (Natural Merge Sort) Algorithm
+
+## 1. Category / Type
+"""
+Hybrid, adaptive, stable comparison sort (Merge Sort + Binary Insertion Sort).
+"""
+
+## 2. Core Idea / Intuition
+"""
+Real-world data is rarely random: it usually contains stretches that are already in order (natural runs). TimSort scans the input for these runs, reverses strictly descending ones, and extends short runs to a minimum length with binary insertion sort. The runs are pushed on a stack and merged under an invariant that keeps run lengths roughly balanced, so merges stay cheap.
+
+When one run keeps "winning" during a merge, TimSort switches to galloping mode: instead of comparing element by element, it searches exponentially for how many elements it can copy in one block.
+"""
+
+## 3. Steps / Flow
+"""
+1. Compute minrun (between 32 and 64) from n so that n / minrun is close to a power of two.
+2. Scan the next natural run; if it is strictly descending, reverse it in place.
+3. If the run is shorter than minrun, extend it with binary insertion sort.
+4. Push the run on the stack and merge the top runs while the invariants
+   len(X) > len(Y) + len(Z) and len(Y) > len(Z) are violated.
+5. Before merging two runs, skip the prefix of the left run and the suffix of the right run that are already in place.
+6. During a merge, switch to galloping after `min_gallop` consecutive wins from one side.
+7. At the end, merge everything left on the stack.
+"""
+
+## 4. Time & Space Complexity
+"""
+| Best | Average    | Worst      | Space |
+|------|------------|------------|-------|
+| O(n) | O(n log n) | O(n log n) | O(n)  |
+
+- Presorted or reverse-sorted input is a single run: n - 1 comparisons and no merges.
+- Input made of r runs costs O(n log r).
+"""
+
+## 5. Use Cases
+"""
+- Nearly-sorted feeds (appended logs, incrementally updated tables).
+- Data built by concatenating sorted chunks.
+- Any case needing a stable sort with good worst-case behaviour.
+"""
+
+## 6. Common Variants
+"""
+- Natural Merge Sort: Merges natural runs without minrun extension or galloping.
+- Powersort: Chooses merge order from run boundaries ("node power"), used by CPython since 3.11.
+"""
+
+## 7. Trade-offs
+"""
+- Adaptive: linear on presorted data, never worse than O(n log n).
+- Stable, unlike Quick Sort and Heap Sort.
+- Needs up to n/2 extra slots for merging and is considerably more complex than plain Merge Sort.
+"""
+
+## 8. Pitfalls / Gotchas
+"""
+- Descending runs must be strictly descending, otherwise reversing them breaks stability.
+- The original stack invariant only checked the top three runs; it must also check the fourth one to stay balanced.
+- Galloping only pays off on structured data, so the threshold must adapt.
+"""
+
+## 9. Classic Problems
+"""
+- Python's list.sort / sorted and Java's Arrays.sort for objects.
+- Merging many pre-sorted batches.
+"""
+
+## 10. Code Implementation (Demo)
+from bisect import bisect_left, bisect_right
+
+from key_sort_algo import load_module
+
+# Short runs are extended with the binary insertion sort of insertion_sort_algo.py
+binary_insertion_sort = load_module("insertion_sort_algo.py").binary_insertion_sort
+
+MIN_GALLOP = 7
+
+
+def compute_min_run(n):
+    """Returns minrun in [32, 64] so that n / minrun is a power of two or slightly less."""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def count_run(arr, lo, hi):
+    """Returns the length of the run starting at lo, reversing it if strictly descending."""
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1, False
+    if arr[run_hi] < arr[lo]:
+        while run_hi + 1 < hi and arr[run_hi + 1] < arr[run_hi]:
+            run_hi += 1
+        run_hi += 1
+        arr[lo:run_hi] = arr[lo:run_hi][::-1]
+        return run_hi - lo, True
+    while run_hi + 1 < hi and not arr[run_hi + 1] < arr[run_hi]:
+        run_hi += 1
+    return run_hi + 1 - lo, False
+
+
+def gallop(seq, key, lo, hi, right):
+    """Exponential search from lo, then bisect: first index in seq[lo:hi] past key.
+
+    With right=False it stops at the first element >= key (bisect_left),
+    with right=True at the first element > key (bisect_right).
+    """
+    search = bisect_right if right else bisect_left
+    step = 1
+    prev = lo
+    probe = lo
+    while probe < hi and (not key < seq[probe] if right else seq[probe] < key):
+        prev = probe + 1
+        probe = lo + step
+        step <<= 1
+    return search(seq, key, prev, min(probe, hi))
+
+
+def natural_merge_sort(arr, stats=None):
+    """
+    Sorts arr in place with a TimSort-style natural merge sort and returns it.
+
+    If a dict is passed as `stats` it is filled with run statistics:
+    "runs" (natural runs found), "descending_runs", "extended_runs"
+    (runs lengthened by binary insertion), "merges" and "gallops".
+    """
+    if stats is None:
+        stats = {}
+    stats.update(runs=0, descending_runs=0, extended_runs=0, merges=0, gallops=0)
+    n = len(arr)
+    if n < 2:
+        stats["runs"] = n
+        return arr
+
+    min_gallop = MIN_GALLOP
+    runs = []  # stack of (base, length)
+
+    def merge_at(i):
+        nonlocal min_gallop
+        base1, len1 = runs[i]
+        base2, len2 = runs[i + 1]
+        runs[i] = (base1, len1 + len2)
+        del runs[i + 1]
+        stats["merges"] += 1
+
+        # Elements of run 1 <= run2[0] and of run 2 >= run1[-1] are already in place
+        start = bisect_right(arr, arr[base2], base1, base2)
+        end = bisect_left(arr, arr[base2 - 1], base2, base2 + len2)
+        if start == base2 or end == base2:
+            return
+
+        tmp = arr[start:base2]
+        i1, end1 = 0, len(tmp)
+        j, k = base2, start
+        wins1 = wins2 = 0
+        while i1 < end1 and j < end:
+            if arr[j] < tmp[i1]:
+                arr[k] = arr[j]
+                j += 1
+                k += 1
+                wins2 += 1
+                wins1 = 0
+                if wins2 >= min_gallop:
+                    stop = gallop(arr, tmp[i1], j, end, right=False)
+                    copied = stop - j
+                    arr[k:k + copied] = arr[j:stop]
+                    k += copied
+                    j = stop
+                    wins2 = 0
+                    stats["gallops"] += 1
+                    # Reward galloping when it copies a long block, penalise it otherwise
+                    min_gallop = max(1, min_gallop - 1) if copied >= MIN_GALLOP else min_gallop + 1
+            else:
+                arr[k] = tmp[i1]
+                i1 += 1
+                k += 1
+                wins1 += 1
+                wins2 = 0
+                if wins1 >= min_gallop:
+                    stop = gallop(tmp, arr[j], i1, end1, right=True)
+                    copied = stop - i1
+                    arr[k:k + copied] = tmp[i1:stop]
+                    k += copied
+                    i1 = stop
+                    wins1 = 0
+                    stats["gallops"] += 1
+                    # Reward galloping when it copies a long block, penalise it otherwise
+                    min_gallop = max(1, min_gallop - 1) if copied >= MIN_GALLOP else min_gallop + 1
+        # Whatever is left of run 2 is already in its final place
+        arr[k:k + end1 - i1] = tmp[i1:]
+
+    def merge_collapse():
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or \
+                    (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            merge_at(i)
+
+    min_run = compute_min_run(n)
+    lo = 0
+    while lo < n:
+        run_len, descending = count_run(arr, lo, n)
+        stats["runs"] += 1
+        stats["descending_runs"] += descending
+        if run_len < min_run:
+            forced = min(min_run, n - lo)
+            binary_insertion_sort(arr, lo, lo + forced)
+            run_len = forced
+            stats["extended_runs"] += 1
+        runs.append((lo, run_len))
+        merge_collapse()
+        lo += run_len
+
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        merge_at(i)
+    return arr
+
+
+# Example usage
+# data = list(range(1000)) + [5, 3, 1]
+# stats = {}
+# natural_merge_sort(data, stats)
+# print(data[:5], stats["runs"])  # Output: [0, 1, 1, 2, 3] 2
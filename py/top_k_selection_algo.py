@@ -0,0 +1,207 @@
+# Top-K Selection (Bounded Heap and Introselect) Algorithm
+
+## 1. Category / Type
+"""
+Selection algorithms: Heap-based (Priority Queue) and Partition-based (Divide and Conquer).
+"""
+
+## 2. Core Idea / Intuition
+"""
+Finding the k largest items, or the k-th smallest item, does not require sorting everything.
+
+- Bounded heap: keep a heap of the k best items seen so far, ordered so that its root is the weakest of them. A new item only enters if it beats the root. Works on streams with O(k) memory.
+- Introselect: Quickselect partitions like Quick Sort but only recurses into the side that contains index k, so the expected work is n + n/2 + n/4 + ... = O(n). If partitioning goes badly for too long it switches to median-of-medians pivots, which guarantee O(n) in the worst case.
+- Partial sort: select the k-th element, after which the first k slots hold the k smallest items, then sort only those.
+"""
+
+## 3. Steps / Flow
+"""
+Bounded heap top-k:
+1. Fill a heap with the first k items, weakest at the root, and heapify it.
+2. For each remaining item, if it beats the root, replace the root and sift down.
+3. Heap sort the heap at the end to return the top k in order.
+
+Introselect (k-th smallest, 0-based):
+1. While the range [lo, hi] is larger than a small threshold:
+   - Pick a median-of-three pivot (or a median-of-medians pivot once the depth budget is used up).
+   - Hoare-partition the range; continue in the half that contains k.
+2. Finish the small range with insertion sort; arr[k] is now the answer.
+"""
+
+## 4. Time & Space Complexity
+"""
+| Operation         | Time       | Extra Space |
+|-------------------|------------|-------------|
+| top_k (stream)    | O(n log k) | O(k)        |
+| introselect       | O(n)       | O(log n)    |
+| partial_sort      | O(n + k log k) | O(log n) |
+| median            | O(n)       | O(log n)    |
+"""
+
+## 5. Use Cases
+"""
+- Top 100 scores out of tens of millions, or from an unbounded stream.
+- Medians and percentiles without a full sort.
+- Nearest-neighbour candidate selection.
+"""
+
+## 6. Common Variants
+"""
+- Heap select with a max-heap for the k smallest items.
+- Quickselect (randomized pivot, expected O(n)).
+- Median of medians (BFPRT): deterministic O(n) selection.
+- Floyd-Rivest: samples to pick two pivots close to k, fewer comparisons in practice.
+"""
+
+## 7. Trade-offs
+"""
+- The bounded heap reads each item once and never stores more than k, but costs O(log k) per accepted item.
+- Introselect is faster on in-memory arrays but reorders the array and needs it all in memory.
+- Median of medians has a large constant; it is only the safety net.
+"""
+
+## 8. Pitfalls / Gotchas
+"""
+- Off-by-one: here k is a 0-based rank (k=0 is the minimum).
+- Selection reorders the input; copy it first if the original order matters.
+- For even-length medians both middle elements are needed.
+"""
+
+## 9. Classic Problems
+"""
+- Kth Largest Element in an Array.
+- Top K Frequent Elements.
+- Find Median from Data Stream (with two heaps).
+"""
+
+## 10. Code Implementation (Demo)
+from key_sort_algo import load_module
+
+# Sift-down and heap sort from heap_sort_algo.py, partitioning from introsort() in quick_sort_algo.py
+_heap_sort = load_module("heap_sort_algo.py")
+_quick_sort = load_module("quick_sort_algo.py")
+heapify_iterative = _heap_sort.heapify_iterative
+heap_sort_iterative = _heap_sort.heap_sort_iterative
+_insertion_sort_range = _quick_sort._insertion_sort_range
+_median_of_three = _quick_sort._median_of_three
+_hoare_partition = _quick_sort._hoare_partition
+
+
+def top_k(iterable, k, key=None, largest=True):
+    """
+    Returns the k largest (or smallest) items of any iterable, best first.
+
+    Keeps a bounded max-heap of size k whose root is the weakest item kept,
+    so memory is O(k) and time O(n log k). Ties keep their first-seen order.
+    """
+    if k <= 0:
+        return []
+    heap = []
+    seq = 0
+    for item in iterable:
+        k_value = item if key is None else key(item)
+        # Entries order best first; later items rank lower on ties
+        entry = (_Reversed(k_value), seq, item) if largest else (k_value, seq, item)
+        seq += 1
+        if len(heap) < k:
+            heap.append(entry)
+            if len(heap) == k:
+                for i in range(k // 2 - 1, -1, -1):
+                    heapify_iterative(heap, k, i)
+        elif entry < heap[0]:
+            heap[0] = entry
+            heapify_iterative(heap, k, 0)
+    heap_sort_iterative(heap)
+    return [item for _, _, item in heap]
+
+
+class _Reversed:
+    """Inverts the ordering of a key so that larger keys rank first."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def _median_of_medians(arr, lo, hi):
+    """Moves the median of every group of 5 to the front of the range and selects their median."""
+    groups = 0
+    for start in range(lo, hi + 1, 5):
+        end = min(start + 4, hi)
+        _insertion_sort_range(arr, start, end)
+        mid = (start + end) // 2
+        arr[lo + groups], arr[mid] = arr[mid], arr[lo + groups]
+        groups += 1
+    target = lo + (groups - 1) // 2
+    _select(arr, lo, lo + groups - 1, target, 0)
+    return arr[target]
+
+
+def _select(arr, lo, hi, k, depth_limit):
+    while hi - lo > 16:
+        if depth_limit == 0:
+            pivot = _median_of_medians(arr, lo, hi)
+        else:
+            depth_limit -= 1
+            pivot = arr[_median_of_three(arr, lo, (lo + hi) // 2, hi)]
+        j = _hoare_partition(arr, lo, hi, pivot)
+        if k <= j:
+            hi = j
+        else:
+            lo = j + 1
+    _insertion_sort_range(arr, lo, hi)
+
+
+def introselect(arr, k):
+    """
+    Returns the k-th smallest element (0-based) of arr, reordering arr in place.
+
+    Afterwards arr[k] holds that element, everything before it is <= and
+    everything after it is >=. Median-of-three pivots give O(n) on average;
+    after 2 * log2(n) partitions it switches to median-of-medians pivots,
+    which bounds the worst case at O(n).
+    """
+    n = len(arr)
+    if not 0 <= k < n:
+        raise IndexError("k out of range")
+    _select(arr, 0, n - 1, k, 2 * n.bit_length())
+    return arr[k]
+
+
+def median(arr):
+    """Returns the median of arr using introselect (reorders arr in place)."""
+    n = len(arr)
+    upper = introselect(arr, n // 2)
+    if n % 2:
+        return upper
+    # After selection the lower middle is the maximum of the left part
+    lower = max(arr[i] for i in range(n // 2))
+    return (lower + upper) / 2
+
+
+def partial_sort(arr, k):
+    """Puts the k smallest elements of arr, sorted, in arr[:k]; the rest is left unordered."""
+    n = len(arr)
+    k = min(k, n)
+    if k <= 0:
+        return arr
+    if k < n:
+        _select(arr, 0, n - 1, k - 1, 2 * n.bit_length())
+    heap_sort_iterative(arr, 0, k)
+    return arr
+
+
+# Example usage
+# scores = [15, 3, 99, 42, 8, 77, 23, 61]
+# print(top_k(scores, 3))  # Output: [99, 77, 61]
+# print(top_k(scores, 2, largest=False))  # Output: [3, 8]
+# print(introselect(list(scores), 0))  # Output: 3
+# print(median(list(scores)))  # Output: 32.5
+# print(partial_sort(list(scores), 3)[:3])  # Output: [3, 8, 15]